@@ -3,7 +3,9 @@
 
 # filewise/__init__.py
 
-__version__ = "3.14.1"
+import importlib
+
+__version__ = "3.15.0"
 
 # Define what should be available when using 'from filewise import *'
 __all__ = [
@@ -13,4 +15,16 @@ __all__ = [
     'json_utils',
     'pandas_utils',
     'scripts'
-]
\ No newline at end of file
+]
+
+# Import sub-packages lazily on first attribute access (PEP 562), so that
+# 'import filewise' does not pull in heavy dependencies such as pandas
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -11,12 +11,7 @@ from pathlib import Path
 # Import project modules #
 #------------------------#
 
-from filewise.file_operations.ops_handler import (
-    find_dirs_with_files,
-    find_files,
-    find_items,
-    rename_objects
-)
+from filewise.file_operations.ops_handler import rename_objects
 from filewise.file_operations.path_utils import (
     find_dirs_with_files,
     find_files,
@@ -34,10 +29,7 @@ from pygenutils.strings.string_handler import (
     modify_obj_specs,
     obj_path_specs
 )
-from pygenutils.strings.text_formatters import (
-    format_string,
-    print_format_string
-)
+from pygenutils.strings.text_formatters import print_format_string
 from pygenutils.time_handling.datetime_operators import (
     get_current_datetime,
     get_obj_operation_datetime
@@ -125,7 +117,7 @@ def loop_renamer(obj_list: list,
     In dry run mode, it returns the potential new names without making changes.
     """
     
-    param_keys = list(get_all_caller_args().values())
+    param_keys = list(get_all_caller_args().keys())
     obj_type_arg_pos = find_substring_index(param_keys, "obj_type")
     zero_pad_pos = find_substring_index(param_keys, "zero_padding")
     
@@ -265,12 +257,15 @@ def reorder_objs(path: str,
                         f"(number {zp_arg_pos}) must either be an integer "
                         "equal or greater than 1.\n"
                         "Set to `None` if no zero padding is desired.")
-          
+
+    if zero_padding == "default":
+        # No padding, as in 'loop_renamer'
+        zero_padding = 1
+
     if path is None:
         raise ValueError("A path string or PosixPath must be given.")
         
-    if (not isinstance(index_range, range)) or \
-        (isinstance(index_range, str) and index_range != "all"):
+    if not (isinstance(index_range, range) or index_range == "all"):
         raise TypeError("Index range format must be of range(min, max). "
                         "Select 'all' if the whole available range "
                         "wants to be taken into account.")
@@ -280,7 +275,7 @@ def reorder_objs(path: str,
         obj_list_uneven = find_files(ext_list, path, match_type="ext", top_only=True)
     
     elif obj_type == BASIC_OBJECT_TYPES[1]:
-        obj_list_uneven = find_items(search_path=path, top_only=True, include_root=True, task="directories")
+        obj_list_uneven = find_items(search_path=path, top_only=True, task="directories")
         
     lou = len(obj_list_uneven)
     
@@ -338,20 +333,21 @@ def reorder_objs(path: str,
         #----------------------------------------------#
         
         if obj_type == BASIC_OBJECT_TYPES[0]:
-            conflicting_objs = [find_files(f"*{Path(nff_dR2).stem}*",
+            conflicting_objs = [find_files(Path(nff_dR2).stem,
                                            path,
-                                           match_type="glob",
+                                           match_type="glob_both",
                                            top_only=True)
                                 for nff_dR2 in num_formatted_objs_dry_run_2]
             
         elif obj_type == BASIC_OBJECT_TYPES[1]:
-            conflicting_objs = [find_dirs_with_files(f"*{Path(nff_dR2).stem}*",
-                                                                     path,
-                                                                     match_type="glob",
-                                                                     top_only=True)
+            conflicting_objs = [find_dirs_with_files(Path(nff_dR2).stem,
+                                                     path,
+                                                     match_type="glob_both",
+                                                     top_only=True)
                                 for nff_dR2 in num_formatted_objs_dry_run_2]
         
-        lcos = len(conflicting_objs)
+        # Each renamed object gets its own, possibly empty, list of matches
+        lcos = sum(1 for confl_obj in conflicting_objs if confl_obj)
         
         if lcos > 0:
             
@@ -365,8 +361,6 @@ def reorder_objs(path: str,
                                                              report_file_name,
                                                              FIXED_EXT)
             
-            report_file_obj = open(report_file_path, "w")                    
-         
             timestamp_str_objname_uneven\
             = get_obj_operation_datetime(obj_list_uneven,
                                          "modification", 
@@ -380,19 +374,19 @@ def reorder_objs(path: str,
                                          "modification", 
                                          TIME_FORMAT_STR)
             
-            for objname_uneven, nff_dR2, confl_obj in zip(obj_list_uneven,
-                                                          num_formatted_objs_dry_run_2,
-                                                          conflicting_objs):
-            
-                format_args_conflict_info = (objname_uneven, 
-                                             timestamp_str_objname_uneven,
-                                             nff_dR2,
-                                             timestamp_str_nff_dR2,
-                                             confl_obj, 
-                                             timestamp_str_confl_obj)
-                report_file_obj.write(format_string(CONF_OBJ_INFO_TEMPLATE, format_args_conflict_info))
-                         
-            report_file_obj.close()
+            # Write the whole report in a single call
+            with open(report_file_path, "w") as report_file_obj:
+                report_file_obj.writelines(
+                    CONF_OBJ_INFO_TEMPLATE.format(objname_uneven,
+                                                  timestamp_str_objname_uneven,
+                                                  nff_dR2,
+                                                  timestamp_str_nff_dR2,
+                                                  confl_obj,
+                                                  timestamp_str_confl_obj)
+                    for objname_uneven, nff_dR2, confl_obj in zip(obj_list_uneven,
+                                                                  num_formatted_objs_dry_run_2,
+                                                                  conflicting_objs)
+                )
                 
             if obj_type == BASIC_OBJECT_TYPES[0]:
                 format_args_conflict_warning_files = ("files", report_file_name)
@@ -408,16 +402,11 @@ def reorder_objs(path: str,
             report_file_path = return_report_file_fixed_path(path,
                                                              report_file_name,
                                                              FIXED_EXT)
-            report_file_obj = open(report_file_path, "w")                    
-            
-            for objname_uneven, nff_dR2 in zip(obj_list_uneven, num_formatted_objs_dry_run_2):
-                format_args_dry_run_info = (objname_uneven,
-                                            timestamp_str_objname_uneven,
-                                            nff_dR2,
-                                            timestamp_str_nff_dR2)
-                report_file_obj.write(format_string(CONF_OBJ_INFO_TEMPLATE, format_args_dry_run_info))
-                         
-            report_file_obj.close()
+            with open(report_file_path, "w") as report_file_obj:
+                report_file_obj.writelines(
+                    DRY_RUN_INFO_TEMPLATE.format(objname_uneven, nff_dR2)
+                    for objname_uneven, nff_dR2 in zip(obj_list_uneven, num_formatted_objs_dry_run_2)
+                )
                 
             if obj_type == BASIC_OBJECT_TYPES[0]:
                 format_args_no_conflict_files = ("files", report_file_name)
@@ -457,20 +446,21 @@ def reorder_objs(path: str,
         #----------------------------------------------#
         
         if obj_type == BASIC_OBJECT_TYPES[0]:
-            conflicting_objs = [find_files(f"*{Path(nff_dR).stem}*",
+            conflicting_objs = [find_files(Path(nff_dR).stem,
                                            path,
-                                           match_type="glob",
+                                           match_type="glob_both",
                                            top_only=True)
                                 for nff_dR in num_formatted_objs_dry_run]
         
         elif obj_type == BASIC_OBJECT_TYPES[1]:
-            conflicting_objs = [find_dirs_with_files(f"*{Path(nff_dR).stem}*",
+            conflicting_objs = [find_dirs_with_files(Path(nff_dR).stem,
                                                      path,
-                                                     match_type="glob",
+                                                     match_type="glob_both",
                                                      top_only=True)
                                 for nff_dR in num_formatted_objs_dry_run]
             
-        lcos = len(conflicting_objs)
+        # Each renamed object gets its own, possibly empty, list of matches
+        lcos = sum(1 for confl_obj in conflicting_objs if confl_obj)
         
         if lcos > 0:
             
@@ -484,8 +474,6 @@ def reorder_objs(path: str,
                                                              report_file_name,
                                                              FIXED_EXT)
             
-            report_file_obj = open(report_file_path, "w")                    
-              
             timestamp_str_objname_unevens\
             = get_obj_operation_datetime(obj_list_uneven_slice,
                                          "modification", 
@@ -499,19 +487,19 @@ def reorder_objs(path: str,
                                          "modification", 
                                          TIME_FORMAT_STR)
             
-            for objname_unevens, nff_dR, confl_obj in zip(obj_list_uneven_slice,
-                                                          num_formatted_objs_dry_run,
-                                                          conflicting_objs):
-            
-                format_args_conflict_info_slice = (objname_unevens, 
-                                                   timestamp_str_objname_unevens,
-                                                   nff_dR,
-                                                   timestamp_str_nff_dR,
-                                                   confl_obj,
-                                                   timestamp_str_confl_obj)
-                report_file_obj.write(format_string(CONF_OBJ_INFO_TEMPLATE, format_args_conflict_info_slice))
-                         
-            report_file_obj.close()
+            # Write the whole report in a single call
+            with open(report_file_path, "w") as report_file_obj:
+                report_file_obj.writelines(
+                    CONF_OBJ_INFO_TEMPLATE.format(objname_unevens,
+                                                  timestamp_str_objname_unevens,
+                                                  nff_dR,
+                                                  timestamp_str_nff_dR,
+                                                  confl_obj,
+                                                  timestamp_str_confl_obj)
+                    for objname_unevens, nff_dR, confl_obj in zip(obj_list_uneven_slice,
+                                                                  num_formatted_objs_dry_run,
+                                                                  conflicting_objs)
+                )
                 
             print(f"\n\nSome renamed objs conflict! Information is stored "
                   f"at file '{report_file_name}'.")
@@ -522,14 +510,12 @@ def reorder_objs(path: str,
             report_file_path = return_report_file_fixed_path(path,
                                                              report_file_name,
                                                              FIXED_EXT)
-            report_file_obj = open(report_file_path, "w")                    
-            
-            for objname_unevens, nff_dr in zip(obj_list_uneven_slice, 
-                                               num_formatted_objs_dry_run):
-                format_args_dry_run_info_slice = (objname_unevens, nff_dR)
-                report_file_obj.write(format_string(DRY_RUN_INFO_TEMPLATE, format_args_dry_run_info_slice))
-                         
-            report_file_obj.close()
+            with open(report_file_path, "w") as report_file_obj:
+                report_file_obj.writelines(
+                    DRY_RUN_INFO_TEMPLATE.format(objname_unevens, nff_dR)
+                    for objname_unevens, nff_dR in zip(obj_list_uneven_slice, 
+                                                       num_formatted_objs_dry_run)
+                )
                 
             print("No conflicting objs found. "
                   "Please check the dry-run renaming information "
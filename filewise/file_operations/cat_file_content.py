@@ -6,6 +6,7 @@
 #----------------#
 
 import os
+import sys
 from pathlib import Path
 
 #-------------------------#
@@ -37,18 +38,45 @@ def cat(path: str | Path, mode: str = "r") -> None:
     path_exists = os.path.exists(path)
     
     if path_exists:
+        binary = "b" in mode
+        if binary:
+            # Keep any text already printed ahead of the raw bytes
+            sys.stdout.flush()
+        out = sys.stdout.buffer if binary else sys.stdout
+        newline = b"\n" if binary else "\n"
+        
+        # Read in large blocks and strip each block's lines in one pass,
+        # writing them at once instead of printing line by line
         with open(path, mode=mode) as file_obj:
-            for line in file_obj:
-                line_stripped = line.strip()
-                print(line_stripped)
+            pending = newline[:0]
+            while chunk := file_obj.read(CHUNK_SIZE):
+                lines = (pending + chunk).split(newline)
+                # The last piece may continue in the next block
+                pending = lines.pop()
+                if lines:
+                    out.write(newline.join(line.strip() for line in lines) + newline)
+            if pending:
+                out.write(pending.strip() + newline)
         
     else:
         raise FileNotFoundError("No such file or directory. "
                                 "Try fixing misspellings or check path's components.")        
         
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Size of the blocks read at once, in characters or bytes depending on the mode
+CHUNK_SIZE = 1 << 20
+
 #-------------------#
 # Call the function #
 #-------------------#
-        
-path = input('Enter the relative or absolute path to the file to be read: ')
-cat(path)
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Take the path from the command line if given, else ask for it
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        path = input('Enter the relative or absolute path to the file to be read: ')
+    cat(path)
@@ -5,8 +5,11 @@
 # Import modules #
 #----------------#
 
+import errno
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 #------------------------#
 # Import project modules #
@@ -22,21 +25,348 @@ from pygenutils.operative_systems.os_operations import exit_info, run_system_com
 # Helpers #
 #---------#
 
-def _get_files_in_directory(directory):
+def _get_files_in_directory(directory, is_match=None):
     """
-    Private helper function to get all files in a directory.
+    Private helper function to get all files in a directory,
+    optionally only those whose name matches.
+    
+    The directory is listed with `os.scandir`, whose entries already carry
+    their full path and file type, so no path is rebuilt and no file
+    is stat'ed again. Matching while listing means that only the selected
+    files are ever collected.
 
     Parameters
     ----------
     directory : str
         The directory path to list files from.
+    is_match : callable, optional
+        Predicate taking a file name, truthy if the file is to be kept.
+        If None, all files are kept. Defaults to None.
+    
+    Returns
+    -------
+    list[tuple[str, str]]
+        A list of (full path, file name) pairs for files in the directory.
+    """
+    with os.scandir(directory) as entries:
+        return [(entry.path, entry.name) for entry in entries 
+                if entry.is_file() and (is_match is None or is_match(entry.name))]
+
+
+def _as_list(obj):
+    """
+    Private helper function to wrap a single string argument in a list.
+
+    Parameters
+    ----------
+    obj : str | list
+        A string or a list of strings.
+    
+    Returns
+    -------
+    list
+        The argument itself if it is not a string, else a one-item list.
+    """
+    return [obj] if isinstance(obj, str) else obj
+
+
+def _build_predicate(patterns, match_type):
+    """
+    Private helper function to validate the match type and build
+    a file name predicate specialised for it.
+    
+    The patterns are prepared once, so that each file name is checked
+    with a single C-level call instead of a Python loop over the patterns.
+
+    Parameters
+    ----------
+    patterns : list[str]
+        File extensions or substrings to search for.
+    match_type : str
+        Either "ext" for extensions or "glob" for substrings of the file name.
+    
+    Returns
+    -------
+    callable
+        Predicate taking a file name, truthy if the name matches.
+        
+    Raises
+    ------
+    ValueError
+        If an invalid match_type is provided.
+    """
+    if match_type not in MATCH_TYPES:
+        raise ValueError(MATCH_TYPE_ERROR.format(match_type))
+    
+    if match_type == "ext":
+        suffixes = tuple(f".{ext}" for ext in patterns)
+        return lambda name: name.endswith(suffixes)
+    elif patterns:
+        # One alternation finds any of the substrings in a single scan
+        return re.compile("|".join(map(re.escape, patterns))).search
+    else:
+        return lambda name: False
+
+
+def _copy_file_range(src, dst):
+    """
+    Private helper function to copy a file's content with `os.copy_file_range`.
+    
+    The data never goes through user space, and filesystems supporting it
+    can clone it or copy it server-side instead of reading and writing it.
+
+    Parameters
+    ----------
+    src : str
+        Path of the file to copy.
+    dst : str
+        Path of the copy.
+    
+    Returns
+    -------
+    bool
+        True if the content was copied, False if the caller must fall back
+        to another copying method.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    
+    with open(src, "rb") as fsrc:
+        size = os.fstat(fsrc.fileno()).st_size
+        # Pseudo-files such as those under /proc report a zero size
+        if not size:
+            return False
+        
+        # Let the kernel read ahead more aggressively when the data
+        # has to be read rather than cloned
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        with open(dst, "wb") as fdst:
+            copied = 0
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError as exc:
+                # Not supported by the kernel or filesystems involved
+                if exc.errno in COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                    return False
+                raise
+    return True
+
+
+def _copy_file(src, dst, copy_stat=False):
+    """
+    Private helper function to copy a file's content and permission bits,
+    as `shutil.copy` does for a destination file path, or all its metadata,
+    as `shutil.copy2` does.
+    
+    The content is copied with `os.copy_file_range` where available,
+    otherwise with `shutil.copyfile`.
+
+    Parameters
+    ----------
+    src : str
+        Path of the file to copy.
+    dst : str
+        Path of the copy.
+    copy_stat : bool, optional
+        If True, copies the access and modification times and flags
+        along with the permission bits. Defaults to False.
+    
+    Returns
+    -------
+    None
+    
+    Raises
+    ------
+    shutil.SameFileError
+        If `src` and `dst` are the same file.
+    """
+    # Opening the destination would truncate the source itself
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    if not _copy_file_range(src, dst):
+        shutil.copyfile(src, dst)
+    if copy_stat:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copymode(src, dst)
+
+
+def _move_file(src, name, destination_directories):
+    """
+    Private helper function to move a file to one or more destination directories.
+    
+    The file is copied, with its metadata, to all destinations but the last,
+    and then moved to the last one. Within a filesystem, the move is a single
+    rename(2) call with `os.replace`. Only if the rename crosses filesystems
+    (EXDEV) does `shutil.move` take over and copy the data; any other error
+    is raised as is.
+
+    Parameters
+    ----------
+    src : str
+        Path of the file to move.
+    name : str
+        Name of the file, kept in the destination directories.
+    destination_directories : list[str]
+        Directories where the file will be moved.
+    
+    Returns
+    -------
+    None
+    """
+    if not destination_directories:
+        return
+    
+    # Once moved, the source is gone, so it can only be moved last
+    *copy_targets, move_target = destination_directories
+    for destination_directory in copy_targets:
+        _copy_file(src, os.path.join(destination_directory, name), copy_stat=True)
+        
+    dst = os.path.join(move_target, name)
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def _copy_directory(directory, destination_directory, recursive_in_depth=True, symlinks=False):
+    """
+    Private helper function to copy a directory tree.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to copy.
+    destination_directory : str
+        The destination directory.
+    recursive_in_depth : bool, optional
+        If True, copies into an existing destination directory.
+        Defaults to True.
+    symlinks : bool, optional
+        If True, symbolic links are copied as links, otherwise the files
+        and directories they point to are copied. Defaults to False.
     
     Returns
     -------
-    list[str]
-        A list of full file paths for files in the directory.
+    None
     """
-    return [os.path.join(directory, file) for file in os.listdir(directory)]
+    shutil.copytree(directory, destination_directory, symlinks=symlinks,
+                    dirs_exist_ok=recursive_in_depth)
+
+
+def _submit_tree_copy(directory, destination_directory, executor, dirs_exist_ok=True,
+                      symlinks=False):
+    """
+    Private helper function to recreate the structure of a directory tree
+    and submit the copy of each of its files to a thread pool.
+    
+    Directories are created as they are scanned, so that file copies can
+    start straight away, whereas `shutil.copytree` copies one file at a time.
+    Files are copied with their metadata, as `shutil.copytree` does by default.
+    As there, entries that are neither regular files nor directories,
+    such as named pipes, sockets or device files, are not copied but
+    reported as errors, since reading them could block forever.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to copy.
+    destination_directory : str
+        The destination directory.
+    executor : concurrent.futures.ThreadPoolExecutor
+        The thread pool copying the files.
+    dirs_exist_ok : bool, optional
+        Whether to copy into existing destination directories. Defaults to True.
+    symlinks : bool, optional
+        If True, symbolic links are recreated as links, otherwise the files
+        and directories they point to are copied. Defaults to False.
+    
+    Returns
+    -------
+    futures : list[concurrent.futures.Future]
+        The pending file copies.
+    dir_pairs : list[tuple[str, str]]
+        The (source, destination) directories, each one listed before its
+        subdirectories.
+    errors : list[tuple[str, str, str]]
+        The (source, destination, reason) of each entry that was not copied,
+        in the form used by `shutil.Error`.
+    """
+    futures = []
+    dir_pairs = []
+    errors = []
+    dirs_to_copy = [(directory, destination_directory)]
+    while dirs_to_copy:
+        src_dir, dst_dir = dirs_to_copy.pop()
+        os.makedirs(dst_dir, exist_ok=dirs_exist_ok)
+        dir_pairs.append((src_dir, dst_dir))
+        
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                dst_path = os.path.join(dst_dir, entry.name)
+                try:
+                    if symlinks and entry.is_symlink():
+                        os.symlink(os.readlink(entry.path), dst_path)
+                        shutil.copystat(entry.path, dst_path, follow_symlinks=False)
+                    # Without symlinks, the link targets are copied, as both checks follow them
+                    elif entry.is_dir():
+                        dirs_to_copy.append((entry.path, dst_path))
+                    elif entry.is_file():
+                        futures.append(executor.submit(_copy_file, entry.path, dst_path, True))
+                    elif not os.path.exists(entry.path):
+                        raise FileNotFoundError(f"Dangling symbolic link: '{entry.path}'")
+                    else:
+                        raise shutil.SpecialFileError(f"`{entry.path}` is not a regular file")
+                except OSError as exc:
+                    errors.append((entry.path, dst_path, str(exc)))
+    return futures, dir_pairs, errors
+
+
+def _run_tasks(func, tasks, max_workers=1):
+    """
+    Private helper function to call a function on several argument tuples,
+    either serially or on a thread pool.
+    
+    File operations spend their time in system calls, which release the GIL,
+    so threads overlap them even though Python code runs one at a time.
+
+    Parameters
+    ----------
+    func : callable
+        The function to call.
+    tasks : list[tuple]
+        Positional arguments of each call.
+    max_workers : int | None, optional
+        Number of threads running the calls concurrently. If 1, the calls are
+        made serially; if None, the `ThreadPoolExecutor` default is used.
+        Defaults to 1.
+    
+    Returns
+    -------
+    None
+    
+    Raises
+    ------
+    Exception
+        The first error raised by any of the calls, once all have finished.
+    """
+    if max_workers == 1:
+        for args in tasks:
+            func(*args)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, *args) for args in tasks]
+        for future in futures:
+            future.result()
 
 
 # Main functions #
@@ -45,7 +375,8 @@ def _get_files_in_directory(directory):
 # Operations involving files #
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 
-def move_files(patterns, input_directories, destination_directories, match_type="ext"):
+def move_files(patterns, input_directories, destination_directories, match_type="ext",
+               max_workers=1):
     """
     Moves files based on extensions or glob patterns from input directories to
     destination directories.
@@ -58,8 +389,17 @@ def move_files(patterns, input_directories, destination_directories, match_type=
         Directory or list of directories to search.
     destination_directories : str | list[str]
         Directory or list of directories where files will be moved.
+        With several directories, each file is copied to all of them
+        but the last, and then moved to the last one.
     match_type : str, optional
         Either "ext" for extensions or "glob" for glob patterns. Defaults to "ext".
+    max_workers : int | None, optional
+        Number of threads moving files concurrently, which mainly
+        pays off on network or otherwise high-latency filesystems.
+        If None, the `ThreadPoolExecutor` default is used.
+        Defaults to 1, i.e. one file at a time.
+        If several selected files share a name, they are processed one
+        at a time, so that the last one listed is the one left.
 
     Returns
     -------
@@ -75,27 +415,31 @@ def move_files(patterns, input_directories, destination_directories, match_type=
     PermissionError
         If insufficient permissions to move files.
     """
-    if isinstance(patterns, str):
-        patterns = [patterns]
-    if isinstance(input_directories, str):
-        input_directories = [input_directories]
-    if isinstance(destination_directories, str):
-        destination_directories = [destination_directories]
+    patterns = _as_list(patterns)
+    input_directories = _as_list(input_directories)
+    destination_directories = _as_list(destination_directories)
 
-    match_func = MATCH_TYPE_DICT.get(match_type)
-    if not match_func:
-        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {MTD_KEYS}.")
+    is_match = _build_predicate(patterns, match_type)
 
+    tasks = []
     for input_directory in input_directories:
-        files = _get_files_in_directory(input_directory)  # Using the helper
-        selected_files = [file for file in files if match_func(file, patterns)]
+        selected_files = _get_files_in_directory(input_directory, is_match)
+        
+        # A file can only be moved once at a time, so each task
+        # moves one file to all the destinations
+        tasks.extend((file, name, destination_directories) for file, name in selected_files)
+    
+    # Files sharing a name would race for the same destination paths,
+    # so they are moved in order, the last one listed overwriting the others
+    names = [name for _, name, _ in tasks]
+    if len(set(names)) < len(names):
+        max_workers = 1
         
-        for file in selected_files:
-            for destination_directory in destination_directories:
-                shutil.move(file, os.path.join(destination_directory, os.path.basename(file)))
+    _run_tasks(_move_file, tasks, max_workers)
 
 
-def copy_files(patterns, input_directories, destination_directories, match_type="ext"):
+def copy_files(patterns, input_directories, destination_directories, match_type="ext",
+               max_workers=1):
     """
     Copies files based on extensions or glob patterns from input directories to
     destination directories.
@@ -110,6 +454,13 @@ def copy_files(patterns, input_directories, destination_directories, match_type=
         Directory or list of directories where files will be copied.
     match_type : str, optional
         Either "ext" for extensions or "glob" for glob patterns. Defaults to "ext".
+    max_workers : int | None, optional
+        Number of threads copying files concurrently, which mainly
+        pays off on network or otherwise high-latency filesystems.
+        If None, the `ThreadPoolExecutor` default is used.
+        Defaults to 1, i.e. one file at a time.
+        If several selected files share a name, they are processed one
+        at a time, so that the last one listed is the one left.
 
     Returns
     -------
@@ -125,27 +476,30 @@ def copy_files(patterns, input_directories, destination_directories, match_type=
     PermissionError
         If insufficient permissions to copy files.
     """
-    if isinstance(patterns, str):
-        patterns = [patterns]
-    if isinstance(input_directories, str):
-        input_directories = [input_directories]
-    if isinstance(destination_directories, str):
-        destination_directories = [destination_directories]
+    patterns = _as_list(patterns)
+    input_directories = _as_list(input_directories)
+    destination_directories = _as_list(destination_directories)
 
-    match_func = MATCH_TYPE_DICT.get(match_type)
-    if not match_func:
-        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {MTD_KEYS}.")
+    is_match = _build_predicate(patterns, match_type)
 
+    tasks = []
     for input_directory in input_directories:
-        files = _get_files_in_directory(input_directory)  # Using the helper
-        selected_files = [file for file in files if match_func(file, patterns)]
+        selected_files = _get_files_in_directory(input_directory, is_match)
+        
+        tasks.extend((file, os.path.join(destination_directory, name))
+                     for file, name in selected_files
+                     for destination_directory in destination_directories)
+    
+    # Copies to the same destination path would write into the same file
+    # at once, so they are made in order, the last one listed prevailing
+    destinations = [dst for _, dst in tasks]
+    if len(set(destinations)) < len(destinations):
+        max_workers = 1
         
-        for file in selected_files:
-            for destination_directory in destination_directories:
-                shutil.copy(file, os.path.join(destination_directory, os.path.basename(file)))
+    _run_tasks(_copy_file, tasks, max_workers)
 
 
-def remove_files(patterns, input_directories, match_type="ext"):
+def remove_files(patterns, input_directories, match_type="ext", max_workers=1):
     """
     Removes files based on extensions or glob patterns from input directories.
 
@@ -157,6 +511,11 @@ def remove_files(patterns, input_directories, match_type="ext"):
         Directory or list of directories to search.
     match_type : str, optional
         Either "ext" for extensions or "glob" for glob patterns. Defaults to "ext".
+    max_workers : int | None, optional
+        Number of threads removing files concurrently, which mainly
+        pays off on network or otherwise high-latency filesystems.
+        If None, the `ThreadPoolExecutor` default is used.
+        Defaults to 1, i.e. one file at a time.
 
     Returns
     -------
@@ -172,21 +531,17 @@ def remove_files(patterns, input_directories, match_type="ext"):
     PermissionError
         If insufficient permissions to remove files.
     """
-    if isinstance(patterns, str):
-        patterns = [patterns]
-    if isinstance(input_directories, str):
-        input_directories = [input_directories]
+    patterns = _as_list(patterns)
+    input_directories = _as_list(input_directories)
 
-    match_func = MATCH_TYPE_DICT.get(match_type)
-    if not match_func:
-        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {MTD_KEYS}.")
+    is_match = _build_predicate(patterns, match_type)
 
+    tasks = []
     for input_directory in input_directories:
-        files = _get_files_in_directory(input_directory)  # Using the helper
-        selected_files = [file for file in files if match_func(file, patterns)]
+        selected_files = _get_files_in_directory(input_directory, is_match)
+        tasks.extend((file,) for file, _ in selected_files)
         
-        for file in selected_files:
-            os.remove(file)
+    _run_tasks(os.remove, tasks, max_workers)
 
 
 # Operations involving directories #
@@ -213,17 +568,20 @@ def make_directories(directory_list):
     OSError
         If directory creation fails due to system-level errors.
     """
-    if isinstance(directory_list, str):
-        directory_list = [directory_list]
+    directory_list = _as_list(directory_list)
     
     # Flatten any nested structure
     directory_list = flatten_list(directory_list)
     
-    for directory in directory_list:
-        os.makedirs(directory, exist_ok=True)
+    # os.makedirs creates the missing parents too, so a directory followed
+    # by one of its subdirectories in sorted order needs no call of its own
+    directories = sorted({os.path.normpath(directory) for directory in directory_list})
+    for directory, next_directory in zip(directories, directories[1:] + [""]):
+        if not next_directory.startswith(directory + os.sep):
+            os.makedirs(directory, exist_ok=True)
 
 
-def remove_directories(directory_list):
+def remove_directories(directory_list, max_workers=1):
     """
     Removes the specified directories and their contents.
     
@@ -231,6 +589,11 @@ def remove_directories(directory_list):
     ----------
     directory_list : str | list[str]
         A string or list of directory paths to remove.
+    max_workers : int | None, optional
+        Number of threads removing directories concurrently, which mainly
+        pays off on network or otherwise high-latency filesystems.
+        If None, the `ThreadPoolExecutor` default is used.
+        Defaults to 1, i.e. one directory at a time.
 
     Returns
     -------
@@ -244,11 +607,13 @@ def remove_directories(directory_list):
     OSError
         If directory removal fails due to system-level errors.
     """
-    if isinstance(directory_list, str):
-        directory_list = [directory_list]
+    directory_list = _as_list(directory_list)
 
-    for directory in directory_list:
-        shutil.rmtree(directory, ignore_errors=True)
+    # shutil.rmtree already walks each tree with os.scandir and, on Linux,
+    # removes entries relative to directory descriptors, which also guards
+    # against symlink attacks, so only independent trees are parallelised
+    tasks = [(directory, True) for directory in directory_list]
+    _run_tasks(shutil.rmtree, tasks, max_workers)
 
 
 def move_directories(directories, destination_directories):
@@ -276,17 +641,15 @@ def move_directories(directories, destination_directories):
     OSError
         If directory move operation fails.
     """
-    if isinstance(directories, str):
-        directories = [directories]
-
-    if isinstance(destination_directories, str):
-        destination_directories = [destination_directories]
+    directories = _as_list(directories)
+    destination_directories = _as_list(destination_directories)
 
     for directory, destination_directory in zip(directories, destination_directories):
         shutil.move(directory, destination_directory)
 
 
-def copy_directories(directories, destination_directories, recursive_in_depth=True):
+def copy_directories(directories, destination_directories, recursive_in_depth=True,
+                     max_workers=1, symlinks=False):
     """
     Copies the specified directories to the destination directories.
     Can be recursive or non-recursive.
@@ -299,6 +662,15 @@ def copy_directories(directories, destination_directories, recursive_in_depth=Tr
         A string or list of destination directories.
     recursive_in_depth : bool, optional
         If True, copies directories recursively. Defaults to True.
+    max_workers : int | None, optional
+        Number of threads copying files concurrently, both within and
+        across the directory trees, which mainly pays off on network or
+        otherwise high-latency filesystems. If None, the `ThreadPoolExecutor`
+        default is used. Defaults to 1, i.e. a serial `shutil.copytree`.
+    symlinks : bool, optional
+        If True, symbolic links are copied as links, otherwise the files
+        and directories they point to are copied. Defaults to False,
+        as in `shutil.copytree`.
 
     Returns
     -------
@@ -307,6 +679,9 @@ def copy_directories(directories, destination_directories, recursive_in_depth=Tr
 
     Raises
     ------
+    shutil.Error
+        If some entries could not be copied, such as named pipes.
+        The rest of the tree is still copied.
     FileNotFoundError
         If source directories don't exist.
     PermissionError
@@ -314,17 +689,34 @@ def copy_directories(directories, destination_directories, recursive_in_depth=Tr
     OSError
         If directory copy operation fails.
     """
-    if isinstance(directories, str):
-        directories = [directories]
+    directories = _as_list(directories)
+    destination_directories = _as_list(destination_directories)
 
-    if isinstance(destination_directories, str):
-        destination_directories = [destination_directories]
-
-    for directory, destination_directory in zip(directories, destination_directories):
-        if recursive_in_depth:
-            shutil.copytree(directory, destination_directory, dirs_exist_ok=True)
-        else:
-            shutil.copytree(directory, destination_directory)
+    pairs = list(zip(directories, destination_directories))
+    
+    if max_workers == 1:
+        for directory, destination_directory in pairs:
+            _copy_directory(directory, destination_directory, recursive_in_depth, symlinks)
+    else:
+        # Files of all the trees are copied concurrently
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tree_copies = [_submit_tree_copy(directory, destination_directory, 
+                                             executor, recursive_in_depth, symlinks)
+                           for directory, destination_directory in pairs]
+            
+        all_errors = []
+        for futures, dir_pairs, errors in tree_copies:
+            for future in futures:
+                future.result()
+            # Directory metadata is copied once their contents are written,
+            # subdirectories first, so that read-only modes and times stick
+            for src_dir, dst_dir in reversed(dir_pairs):
+                shutil.copystat(src_dir, dst_dir)
+            all_errors.extend(errors)
+            
+        # Like shutil.copytree, report the skipped entries once all is copied
+        if all_errors:
+            raise shutil.Error(all_errors)
             
 
 # Operations involving both files and directories #
@@ -338,7 +730,7 @@ def rsync(source_paths,
           capture_output=False,
           return_output_name=False,
           encoding="utf-8",
-          shell=True):
+          shell=False):
     """
     Synchronises directories using the rsync command with various options.
     
@@ -361,7 +753,11 @@ def rsync(source_paths,
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Whether to execute the command through the shell. Default is False,
+        which runs rsync directly, without spawning an intermediate shell,
+        and passes paths with spaces or special characters unchanged.
+        If True, the arguments are joined with spaces, unquoted, so that
+        the shell expands globs, '~' and environment variables in the paths.
     
     Raises
     ------
@@ -369,11 +765,8 @@ def rsync(source_paths,
         If the length of the source_paths and destination_paths lists is not equal.
     """
     
-    if isinstance(source_paths, str):
-        source_paths = [source_paths]
-    
-    if isinstance(destination_paths, str):
-        destination_paths = [destination_paths]
+    source_paths = _as_list(source_paths)
+    destination_paths = _as_list(destination_paths)
 
     if len(source_paths) != len(destination_paths):
         raise ValueError("The length of source_paths and destination_paths must be equal.")
@@ -394,9 +787,10 @@ def rsync(source_paths,
         rsync_template.append(sp)
         rsync_template.append(dp)
 
-        # Run the rsync command
+        # Run the rsync command, as a single line if a shell is to expand it
+        command = " ".join(rsync_template) if shell else rsync_template
         process_exit_info = run_system_command(
-            " ".join(rsync_template),
+            command,
             capture_output=capture_output,
             return_output_name=return_output_name,
             encoding=encoding,
@@ -450,13 +844,15 @@ def rename_objects(relative_paths, renaming_relative_paths):
 UNEQUAL_LENGTH_ERROR = """File and renamed file lists are not of the same length."""
 OBJTYPE_ERROR = "Both input arguments must either be strings or lists simultaneously."
 
-# Switch-case Dictionary #
-#------------------------#
+# Copying #
+# Error numbers after which os.copy_file_range gives way to shutil.copyfile
+COPY_FILE_RANGE_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ETXTBSY
+})
 
-# Define a switch-case dictionary to handle 'match_type' options
-MATCH_TYPE_DICT = {
-    "ext": lambda file, patterns: any(file.endswith(f".{ext}") for ext in patterns),
-    "glob": lambda file, patterns: any(pattern in file for pattern in patterns)
-}
+# Match types #
+# Valid 'match_type' options, each matched by a predicate built in `_build_predicate`
+MATCH_TYPES = frozenset({"ext", "glob"})
 
-MTD_KEYS = list(MATCH_TYPE_DICT.keys())
\ No newline at end of file
+# Error for an invalid 'match_type', with the choices formatted only once
+MATCH_TYPE_ERROR = "Invalid match_type '{}'. Choose one from " + str(sorted(MATCH_TYPES)) + "."
@@ -1,14 +1,44 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+"""
+**Purpose**
+
+File and directory search utilities built on a single directory traversal.
+
+**Performance notes**
+
+The cost of a search is dominated by reading directories, that is by
+`readdir`/`stat` system calls and by crossing into the OS, not by
+computation. Optimisation work should therefore aim, in this order, at:
+
+1. Issuing fewer system calls: `os.scandir` and the file type cached in
+   each `os.DirEntry`, with no `stat` per entry.
+2. Pruning excluded subtrees before they are read.
+3. Overlapping the remaining I/O, with threads (`max_workers`, the GIL is
+   released while listing) or processes (`processes`).
+4. Avoiding repeated work, through the compiled pattern cache and the
+   optional directory listing cache (`use_cache`).
+
+Name matching is already a single set lookup or compiled regex match per
+file, so vectorised or compiled matching is unlikely to pay off.
+"""
+
 #----------------#
 # Import modules #
 #----------------#
 
 import fnmatch
+import heapq
+import multiprocessing
 import os
 import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
+from itertools import compress
+from types import SimpleNamespace
 
 #------------------------#
 # Import project modules #
@@ -23,14 +53,15 @@ from pygenutils.arrays_and_lists.data_manipulation import flatten_list
 # Helpers #
 #---------#
 
-def _unique_sorted(items: list) -> list:
+def _unique_sorted(items: Iterable) -> list:
     """
     Returns a sorted list of unique items.
     
     Parameters
     ----------
-    items : list
-        List of items to deduplicate and sort.
+    items : Iterable
+        Items to deduplicate and sort. Generators are consumed directly
+        into the set, without an intermediate list.
         
     Returns
     -------
@@ -39,54 +70,307 @@ def _unique_sorted(items: list) -> list:
     """
     return sorted(set(items))
 
-@lru_cache(maxsize=128)
-def _compile_pattern(pattern: str) -> re.Pattern:
+def _maybe_flatten(items: list) -> list:
+    """
+    Flattens a list only if it is actually nested.
+    
+    The common case of a flat list of strings is detected in a single pass
+    and returned as is, skipping the recursive copy made by `flatten_list`.
+    
+    Parameters
+    ----------
+    items : list
+        List to flatten, possibly nested.
+        
+    Returns
+    -------
+    list
+        The flat list.
+        
+    Examples
+    --------
+    >>> _maybe_flatten(['py', 'txt'])
+    ['py', 'txt']
+    >>> _maybe_flatten(['py', ['txt', 'md']])
+    ['py', 'txt', 'md']
+    """
+    for item in items:
+        if not isinstance(item, str):
+            return flatten_list(items)
+    return items
+
+def _file_name(entry: os.DirEntry | str) -> str | None:
+    """
+    Returns the base name of a directory entry if it refers to a file.
+    
+    Plain path strings are also accepted for backwards compatibility,
+    in which case the file check falls back to `os.path.isfile`.
+    
+    Parameters
+    ----------
+    entry : os.DirEntry | str
+        The directory entry or path to inspect.
+        
+    Returns
+    -------
+    str | None
+        The base name of the file, or None if the entry is not a file.
     """
-    Compiles a glob pattern into a regex pattern for faster matching.
+    if isinstance(entry, str):
+        return os.path.basename(entry) if os.path.isfile(entry) else None
+    return entry.name if entry.is_file() else None
+
+def _build_ext_set(extensions: list | frozenset, 
+                   lowercase: bool = True, 
+                   empty: str = ".") -> frozenset:
+    """
+    Builds a set of dotted extensions for constant-time lookups.
+    
+    Parameters
+    ----------
+    extensions : list | frozenset
+        Extensions, with or without the leading dot.
+    lowercase : bool, optional
+        Whether to lowercase the extensions. Defaults to True.
+    empty : str, optional
+        What an empty extension stands for, as returned by `os.path.splitext`:
+        "." for names ending in a dot, as matched by `find_files`,
+        or "" for names without extension, as skipped by `find_items`.
+        Defaults to ".".
+        
+    Returns
+    -------
+    frozenset
+        Set of extensions in '.ext' form.
+        
+    Examples
+    --------
+    >>> sorted(_build_ext_set(['txt', '.PDF']))
+    ['.pdf', '.txt']
+    >>> sorted(_build_ext_set(['txt', ''], empty=''))
+    ['', '.txt']
+    """
+    if lowercase:
+        extensions = (ext.lower() for ext in extensions)
+    return frozenset(f".{ext.lstrip('.')}" if ext else empty for ext in extensions)
+
+def _match_ext(entry: os.DirEntry | str, 
+               patterns: list | frozenset, 
+               case_sensitive: bool = True) -> bool:
+    """
+    Matches a directory entry against a set of file extensions.
+    The comparison is always case-insensitive.
+    
+    Parameters
+    ----------
+    entry : os.DirEntry | str
+        The directory entry (or file path) to match.
+    patterns : list | frozenset
+        List of extensions to match against, or the set already
+        built by `_build_ext_set`.
+    case_sensitive : bool, optional
+        Kept for signature compatibility with the other matchers.
+        
+    Returns
+    -------
+    bool
+        True if the file has any of the extensions, False otherwise.
+    """
+    name = _file_name(entry)
+    if name is None:
+        return False
+    
+    if not isinstance(patterns, frozenset):
+        patterns = _build_ext_set(patterns)
+    
+    return os.path.splitext(name)[1].lower() in patterns
+
+@lru_cache(maxsize=4096)
+def _compile_patterns_union(patterns: tuple[str, ...], flags: int = 0) -> re.Pattern:
+    """
+    Compiles a set of glob patterns into a single regex alternation,
+    so that each file name is matched with one regex call.
+    
+    The cache is keyed by both the patterns and the regex flags, so
+    case-insensitive searches reuse the same patterns instead of
+    compiling lowercased copies of them.
     
     Parameters
     ----------
-    pattern : str
-        The glob pattern to compile.
+    patterns : tuple[str, ...]
+        The glob patterns to compile. A tuple is required for caching.
+    flags : int, optional
+        Regex flags, e.g. `re.IGNORECASE` for case-insensitive matching.
+        Defaults to 0.
         
     Returns
     -------
     re.Pattern
-        Compiled regex pattern.
+        Compiled regex pattern matching any of the glob patterns.
     """
-    return re.compile(fnmatch.translate(pattern))
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns), flags)
 
-def _match_glob(file: str, patterns: list, case_sensitive: bool = True) -> bool:
+def _match_glob(entry: os.DirEntry | str, 
+                patterns: list | re.Pattern, 
+                case_sensitive: bool = True) -> bool:
     """
-    Matches a file against a list of glob patterns.
+    Matches a directory entry against a list of glob patterns.
     
     Parameters
     ----------
-    file : str
-        The file path to match.
-    patterns : list
-        List of glob patterns to match against.
+    entry : os.DirEntry | str
+        The directory entry (or file path) to match.
+    patterns : list | re.Pattern
+        List of glob patterns to match against, or the pattern
+        already compiled by `_compile_patterns_union`.
     case_sensitive : bool, optional
-        Whether to perform case-sensitive matching. Defaults to True.
+        Whether to perform case-sensitive matching. Only used when
+        `patterns` is not compiled yet. Defaults to True.
         
     Returns
     -------
     bool
         True if the file matches any pattern, False otherwise.
     """
-    if not os.path.isfile(file):
+    basename = _file_name(entry)
+    if basename is None:
         return False
+    
+    if not isinstance(patterns, re.Pattern):
+        flags = 0 if case_sensitive else re.IGNORECASE
+        patterns = _compile_patterns_union(tuple(patterns), flags)
+    
+    return patterns.match(basename) is not None
+
+def _list_dir_cached(dirpath: str) -> list[os.DirEntry]:
+    """
+    Lists a directory, reusing the listing of a previous call
+    if the directory has not been modified since.
+    
+    A directory's modification time changes whenever an entry is added,
+    removed or renamed in it, so it is enough to validate the listing with
+    a single `stat` call instead of reading the directory again.
+    
+    Parameters
+    ----------
+    dirpath : str
+        The directory path to list.
+        
+    Returns
+    -------
+    list[os.DirEntry]
+        The entries of the directory. Callers must not modify it.
+    """
+    mtime = os.stat(dirpath).st_mtime_ns
+    cached = _DIR_CACHE.get(dirpath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with os.scandir(dirpath) as entries:
+        listing = list(entries)
+    
+    with _DIR_CACHE_LOCK:
+        # Evict the oldest listing to keep the cache bounded
+        if len(_DIR_CACHE) >= DIR_CACHE_MAXSIZE and dirpath not in _DIR_CACHE:
+            del _DIR_CACHE[next(iter(_DIR_CACHE))]
+        _DIR_CACHE[dirpath] = (mtime, listing)
+    return listing
+
+def _fetch_dir_batches(path: str, 
+                       glob_bool: bool = True, 
+                       dirs_to_exclude: list | None = None,
+                       max_workers: int | None = 1,
+                       use_cache: bool = False) -> Iterator[list[os.DirEntry]]:
+    """
+    Scans a path and yields its items grouped by parent directory.
+
+    Each `os.DirEntry` keeps the file type reported by the directory listing,
+    so callers can rely on `entry.is_file()` and `entry.is_dir()` without
+    issuing further `stat` calls.
+
+    Parameters
+    ----------
+    path : str
+        The directory path to search within.
+    glob_bool : bool, optional
+        If True, scans all subdirectories recursively. Defaults to True.
+    dirs_to_exclude : list | None, optional
+        Substrings identifying the paths to leave out. Excluded directories
+        are not descended into. Defaults to None.
+    max_workers : int | None, optional
+        Number of threads scanning directories concurrently when `glob_bool`
+        is True. If 1, directories are scanned serially; if None, the
+        `ThreadPoolExecutor` default is used. Defaults to 1.
+    use_cache : bool, optional
+        If True, directory listings are kept between calls and only read
+        again once the directory has been modified. See `_list_dir_cached`.
+        Defaults to False.
+        
+    Yields
+    ------
+    list[os.DirEntry]
+        The files and directories found in one scanned directory.
+    """
+    # A single regex alternation finds any of the excluded substrings
+    # in one scan of each path
+    if dirs_to_exclude:
+        exclude_search = re.compile("|".join(map(re.escape, dirs_to_exclude))).search
+    
+    # On Linux, os.scandir reads entries through getdents64 in large
+    # buffers and takes file types from d_type, so listing a directory
+    # costs a few syscalls regardless of its size and no stat per entry
+    def prune(entries):
+        # Every path below an excluded directory contains it too,
+        # so skipping the entry prunes its whole subtree
+        if dirs_to_exclude:
+            return [entry for entry in entries if not exclude_search(entry.path)]
+        return list(entries)
+    
+    def scan(dirpath):
+        try:
+            if use_cache:
+                return prune(_list_dir_cached(dirpath))
+            with os.scandir(dirpath) as entries:
+                return prune(entries)
+        except OSError:
+            if not glob_bool:
+                raise
+            # Unreadable subdirectories are skipped, as os.walk does
+            return []
         
-    basename = os.path.basename(file)
-    if not case_sensitive:
-        basename = basename.lower()
-        patterns = [p.lower() for p in patterns]
+    def subdirs(batch):
+        # Symbolic links to directories are listed but not followed
+        return [entry.path for entry in batch if entry.is_dir(follow_symlinks=False)]
     
-    return any(_compile_pattern(pattern).match(basename) for pattern in patterns)
+    if not glob_bool:
+        yield scan(path)
+        
+    elif max_workers == 1:
+        dirs_to_scan = [path]
+        while dirs_to_scan:
+            batch = scan(dirs_to_scan.pop())
+            dirs_to_scan.extend(subdirs(batch))
+            yield batch
+            
+    else:
+        # os.scandir releases the GIL while listing, so threads overlap
+        # the directory reads of independent subtrees
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(scan, path)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = future.result()
+                    pending.update(executor.submit(scan, subdir) for subdir in subdirs(batch))
+                    yield batch
 
-def _fetch_path_items(path: str, glob_bool: bool = True) -> list[str]:
+def _fetch_path_items(path: str, 
+                      glob_bool: bool = True, 
+                      dirs_to_exclude: list | None = None,
+                      max_workers: int | None = 1,
+                      use_cache: bool = False) -> list[os.DirEntry]:
     """
-    Converts a path into an os-based path and handles globbing.
+    Scans a path and returns its items as directory entries.
 
     Parameters
     ----------
@@ -94,24 +378,193 @@ def _fetch_path_items(path: str, glob_bool: bool = True) -> list[str]:
         The directory path to search within.
     glob_bool : bool, optional
         If True, finds all files and directories recursively. Defaults to True.
+    dirs_to_exclude : list | None, optional
+        Substrings identifying the paths to leave out. Excluded directories
+        are not descended into. Defaults to None.
+    max_workers : int | None, optional
+        Number of threads scanning directories concurrently.
+        See `_fetch_dir_batches`. Defaults to 1.
+    use_cache : bool, optional
+        Whether to reuse unmodified directory listings.
+        See `_fetch_dir_batches`. Defaults to False.
         
     Returns
     -------
-    list[str]
+    list[os.DirEntry]
         A list of all files and directories found in the specified path.
     """
-    if glob_bool:
-        items = []
-        for dirpath, dirnames, filenames in os.walk(path):
-            items.extend([os.path.join(dirpath, dirname) for dirname in dirnames])
-            items.extend([os.path.join(dirpath, file) for file in filenames])
-        return items
+    return [entry 
+            for batch in _fetch_dir_batches(path, glob_bool, dirs_to_exclude, 
+                                            max_workers, use_cache) 
+            for entry in batch]
+
+def _build_predicate(patterns: str | list, 
+                     match_type: str, 
+                     case_sensitive: bool = True) -> Callable[[str], object]:
+    """
+    Validates the match type and builds a file name predicate specialised
+    for it, with the pattern lookups computed once per search.
+    The built-in match types are dispatched by name; any other match type,
+    registered in both `MATCH_PATTERN_MODIFIER` and `MATCH_TYPE_DICT`,
+    falls back to calling its matcher. Such registrations are not seen by
+    the worker processes of `find_files`, which import this module anew.
+    
+    Parameters
+    ----------
+    patterns : str | list
+        File extensions or glob patterns to search for. Supports nested lists.
+    match_type : str
+        The type of matching to apply. See `find_files`.
+    case_sensitive : bool, optional
+        Whether to perform case-sensitive matching. Only applies to
+        glob patterns. Defaults to True.
+        
+    Returns
+    -------
+    Callable[[str], object]
+        Predicate taking a file name, truthy if the name matches.
+        
+    Raises
+    ------
+    ValueError
+        If an invalid `match_type` is provided.
+    """
+    # Handle nested lists with defensive programming
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    elif isinstance(patterns, list):
+        patterns = _maybe_flatten(patterns)
+        
+    # Looked up on each call, so that match types registered later are found
+    modify_pattern_func = MATCH_PATTERN_MODIFIER.get(match_type)
+    match_func = MATCH_TYPE_DICT.get(match_type)
+    if not (modify_pattern_func and match_func):
+        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {list(MATCH_TYPE_DICT)}")
+    
+    patterns = modify_pattern_func(patterns)
+    
+    if match_type == "ext":
+        ext_set = _build_ext_set(patterns)
+        splitext = os.path.splitext
+        return lambda name: splitext(name)[1].lower() in ext_set
+    elif match_type in ("glob_left", "glob_right", "glob_both"):
+        flags = 0 if case_sensitive else re.IGNORECASE
+        # The glob modifiers already return tuples, so this does not copy
+        return _compile_patterns_union(tuple(patterns), flags).match
+    elif match_type == "ww":
+        return frozenset(patterns).__contains__
     else:
-        return [os.path.join(path, item) for item in os.listdir(path)]
+        # Matchers of any other registered match type are called as they are,
+        # with each name standing for a file entry, since callers only pass
+        # the names of entries already known to be files
+        return lambda name: match_func(SimpleNamespace(name=name, is_file=lambda: True),
+                                       patterns, case_sensitive)
+
+def _select_matches(entries: list[os.DirEntry], 
+                    is_match: Callable[[str], object]) -> list[os.DirEntry]:
+    """
+    Selects the files among some directory entries whose name
+    is accepted by a predicate.
+    
+    The file names are collected first and then matched with `map` and
+    `itertools.compress`, so the selection loop itself runs in C.
+    
+    Parameters
+    ----------
+    entries : list[os.DirEntry]
+        The directory entries to match.
+    is_match : Callable[[str], object]
+        Predicate built by `_build_predicate`.
+        
+    Returns
+    -------
+    list[os.DirEntry]
+        The entries that are files and whose name matches.
+    """
+    files = [entry for entry in entries if entry.is_file()]
+    names = [entry.name for entry in files]
+    return list(compress(files, map(is_match, names)))
+
+def _iter_matches(search_path: str, 
+                  is_match: Callable[[str], object], 
+                  top_only: bool, 
+                  dirs_to_exclude: list, 
+                  max_workers: int | None,
+                  use_cache: bool = False) -> Iterator[str]:
+    """
+    Yields the paths of the files whose name is accepted by a predicate,
+    one scanned directory at a time.
+    
+    Parameters
+    ----------
+    search_path : str
+        The directory path to search within.
+    is_match : Callable[[str], object]
+        Predicate built by `_build_predicate`.
+    top_only : bool
+        If True, only searches in the top directory.
+    dirs_to_exclude : list
+        Substrings identifying the paths to leave out.
+    max_workers : int | None
+        Number of threads scanning directories concurrently.
+    use_cache : bool, optional
+        Whether to reuse unmodified directory listings. Defaults to False.
+        
+    Yields
+    ------
+    str
+        Path of a matching file.
+    """
+    for batch in _fetch_dir_batches(search_path, 
+                                    glob_bool=not top_only, 
+                                    dirs_to_exclude=dirs_to_exclude,
+                                    max_workers=max_workers,
+                                    use_cache=use_cache):
+        for entry in _select_matches(batch, is_match):
+            yield entry.path
+
+def _get_mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Returns the multiprocessing context for the subtree workers.
+    
+    A start method set by the caller with `multiprocessing.set_start_method`
+    is always honoured. Otherwise 'forkserver' is used where available, and
+    the platform default elsewhere. 'fork' is never chosen implicitly:
+    forking a process that already runs threads, such as those of the
+    threaded directory scan, can deadlock the children, and it is unsafe
+    on macOS.
+    
+    Returns
+    -------
+    multiprocessing.context.BaseContext
+        The multiprocessing context.
+    """
+    if multiprocessing.get_start_method(allow_none=True) is not None:
+        return multiprocessing.get_context()
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
+def _find_files_worker(args: tuple) -> list[str]:
+    """
+    Runs a single-process `find_files` search on one subtree.
+    Defined at module level so that it can be pickled.
+    
+    Parameters
+    ----------
+    args : tuple
+        Positional arguments for `find_files`.
+        
+    Returns
+    -------
+    list[str]
+        Sorted list of the matching files in the subtree.
+    """
+    return find_files(*args)
     
     
 # Switch-case dictionary to modify patterns based on 'match_type' argument 
-def _add_glob_left(patterns: list) -> list:
+def _add_glob_left(patterns: list) -> tuple:
     """
     Add wildcard at the beginning of patterns (to match end of filename).
 
@@ -122,17 +575,18 @@ def _add_glob_left(patterns: list) -> list:
 
     Returns
     -------
-    list
-        List of patterns with '*' prepended to each pattern.
+    tuple
+        Patterns with '*' prepended to each pattern, as a tuple
+        so that it can key the compiled regex cache without a copy.
 
     Examples
     --------
     >>> _add_glob_left(['txt', 'pdf'])
-    ['*txt', '*pdf']
+    ('*txt', '*pdf')
     """
-    return [f"*{pattern}" for pattern in patterns]
+    return tuple(f"*{pattern}" for pattern in patterns)
 
-def _add_glob_right(patterns: list) -> list:
+def _add_glob_right(patterns: list) -> tuple:
     """
     Add wildcard at the end of patterns (to match beginning of filename).
 
@@ -143,17 +597,18 @@ def _add_glob_right(patterns: list) -> list:
 
     Returns
     -------
-    list
-        List of patterns with '*' appended to each pattern.
+    tuple
+        Patterns with '*' appended to each pattern, as a tuple
+        so that it can key the compiled regex cache without a copy.
 
     Examples
     --------
     >>> _add_glob_right(['doc', 'img'])
-    ['doc*', 'img*']
+    ('doc*', 'img*')
     """
-    return [f"{pattern}*" for pattern in patterns]
+    return tuple(f"{pattern}*" for pattern in patterns)
 
-def _add_glob_both(patterns: list) -> list:
+def _add_glob_both(patterns: list) -> tuple:
     """
     Add wildcards at both ends of patterns (to match anywhere in filename).
 
@@ -164,15 +619,16 @@ def _add_glob_both(patterns: list) -> list:
 
     Returns
     -------
-    list
-        List of patterns with '*' prepended and appended to each pattern.
+    tuple
+        Patterns with '*' prepended and appended to each pattern, as a tuple
+        so that it can key the compiled regex cache without a copy.
 
     Examples
     --------
     >>> _add_glob_both(['test', 'data'])
-    ['*test*', '*data*']
+    ('*test*', '*data*')
     """
-    return [f"*{pattern}*" for pattern in patterns]
+    return tuple(f"*{pattern}*" for pattern in patterns)
 
 def _whole_word(patterns: list) -> list:
     """
@@ -207,7 +663,11 @@ def find_files(patterns: str | list,
                match_type: str = "ext", 
                top_only: bool = False, 
                dirs_to_exclude: str | list | None = None, 
-               case_sensitive: bool = True) -> list[str]:
+               case_sensitive: bool = True,
+               max_workers: int | None = 1,
+               processes: int | None = None,
+               sort: bool = True,
+               use_cache: bool = False) -> list[str]:
     """
     Searches for files based on extensions or glob patterns with various matching types.
 
@@ -233,6 +693,32 @@ def find_files(patterns: str | list,
         Defaults to None.
     case_sensitive : bool, optional
         Whether to perform case-sensitive matching. Defaults to True.
+    max_workers : int | None, optional
+        Number of threads scanning subdirectories concurrently, which mainly
+        pays off on network or otherwise high-latency filesystems.
+        If None, the `ThreadPoolExecutor` default is used. Defaults to 1,
+        i.e. a serial scan.
+    processes : int | None, optional
+        Number of processes among which the top-level subdirectories are
+        shared out, each one searched independently. Worth it for large
+        trees where matching, rather than listing, dominates.
+        Ignored if `top_only` is True. Defaults to None, i.e. no extra
+        processes, only the threads set by `max_workers`; this is the safe
+        choice from scripts and interactive sessions.
+        Workers are started with 'forkserver' where available, unless
+        a start method has been set with `multiprocessing.set_start_method`.
+        Like 'spawn', 'forkserver' imports the caller's `__main__` module
+        in every worker, so a calling script must keep its top-level code
+        under an `if __name__ == "__main__":` guard. Otherwise that code is
+        run again in each worker, or the pool fails to start.
+    sort : bool, optional
+        Whether to sort the resulting paths. Defaults to True.
+        Use `find_files_iter` to consume the results as they are found.
+    use_cache : bool, optional
+        If True, directory listings are kept in memory and reused by later
+        searches, as long as the directory's modification time is unchanged.
+        Speeds up repeated searches over the same tree. Use `clear_path_cache`
+        to release them. Defaults to False.
     
     Returns
     -------
@@ -244,38 +730,108 @@ def find_files(patterns: str | list,
     ValueError
         If an invalid `match_type` is provided.
     """
-    # Handle nested lists with defensive programming
-    if isinstance(patterns, str):
-        patterns = [patterns]
-    elif isinstance(patterns, list):
-        patterns = flatten_list(patterns)
+    is_match = _build_predicate(patterns, match_type, case_sensitive)
     
+    # Handle nested lists with defensive programming
     if dirs_to_exclude is None:
         dirs_to_exclude = []
     elif isinstance(dirs_to_exclude, str):
         dirs_to_exclude = [dirs_to_exclude]
     elif isinstance(dirs_to_exclude, list):
-        dirs_to_exclude = flatten_list(dirs_to_exclude)
+        dirs_to_exclude = _maybe_flatten(dirs_to_exclude)
+        
+    if processes is not None and processes > 1 and not top_only:
+        # Match the top-level files here and search every top-level
+        # subdirectory in a worker process, each returning sorted results
+        try:
+            top_entries = _fetch_path_items(search_path, 
+                                            glob_bool=False, 
+                                            dirs_to_exclude=dirs_to_exclude,
+                                            use_cache=use_cache)
+        except OSError:
+            top_entries = []
+            
+        top_matches = sorted(entry.path for entry in 
+                             _select_matches(top_entries, is_match))
+        worker_args = [
+            (patterns, entry.path, match_type, False, 
+             dirs_to_exclude, case_sensitive, max_workers, None, True, use_cache)
+            for entry in top_entries if entry.is_dir(follow_symlinks=False)
+        ]
+        with _get_mp_context().Pool(processes) as pool:
+            subdir_matches = list(pool.imap_unordered(_find_files_worker, worker_args))
+            
+        # Subdirectories are disjoint, so merging the sorted results
+        # needs neither a global sort nor deduplication
+        return list(heapq.merge(top_matches, *subdir_matches))
 
-    modify_pattern_func = MATCH_PATTERN_MODIFIER.get(match_type)
-    if not modify_pattern_func:
-        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {MTD_KEYS}")
+    matches = _iter_matches(search_path, is_match, top_only, 
+                            dirs_to_exclude, max_workers, use_cache)
     
-    patterns = modify_pattern_func(patterns)
+    # A single traversal never yields the same path twice
+    return sorted(matches) if sort else list(matches)
 
-    if top_only:
-        files = _fetch_path_items(search_path, glob_bool=False)
-    else:
-        files = _fetch_path_items(search_path)
 
-    if dirs_to_exclude:
-        files = [file for file in files if not any(excluded in file for excluded in dirs_to_exclude)]
+def find_files_iter(patterns: str | list, 
+                    search_path: str, 
+                    match_type: str = "ext", 
+                    top_only: bool = False, 
+                    dirs_to_exclude: str | list | None = None, 
+                    case_sensitive: bool = True,
+                    max_workers: int | None = 1,
+                    use_cache: bool = False) -> Iterator[str]:
+    """
+    Lazily searches for files based on extensions or glob patterns.
+    
+    Unlike `find_files`, matching paths are yielded as soon as each directory
+    has been scanned, in no particular order, so the whole result never has
+    to be held in memory. Arguments are validated when the function is called.
 
-    match_func = MATCH_TYPE_DICT.get(match_type)
-    if not match_func:
-        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {MTD_KEYS}")
+    Parameters
+    ----------
+    patterns : str | list
+        File extensions or glob patterns to search for.
+    search_path : str
+        The directory path to search within.
+    match_type : str, optional
+        The type of matching to apply. See `find_files`. Defaults to "ext".
+    top_only : bool, optional
+        If True, only searches in the top directory without subdirectories. 
+        Defaults to False.
+    dirs_to_exclude : str | list | None, optional
+        Directory or list of directories to exclude from the search.
+        Defaults to None.
+    case_sensitive : bool, optional
+        Whether to perform case-sensitive matching. Defaults to True.
+    max_workers : int | None, optional
+        Number of threads scanning subdirectories concurrently.
+        See `find_files`. Defaults to 1.
+    use_cache : bool, optional
+        Whether to reuse unmodified directory listings.
+        See `find_files`. Defaults to False.
+    
+    Returns
+    -------
+    Iterator[str]
+        An iterator over the files matching the specified patterns.
 
-    return _unique_sorted([file for file in files if match_func(file, patterns, case_sensitive)])
+    Raises
+    ------
+    ValueError
+        If an invalid `match_type` is provided.
+    """
+    is_match = _build_predicate(patterns, match_type, case_sensitive)
+    
+    # Handle nested lists with defensive programming
+    if dirs_to_exclude is None:
+        dirs_to_exclude = []
+    elif isinstance(dirs_to_exclude, str):
+        dirs_to_exclude = [dirs_to_exclude]
+    elif isinstance(dirs_to_exclude, list):
+        dirs_to_exclude = _maybe_flatten(dirs_to_exclude)
+        
+    return _iter_matches(search_path, is_match, top_only, 
+                         dirs_to_exclude, max_workers, use_cache)
 
 
 # Directory Operations #
@@ -286,7 +842,9 @@ def find_dirs_with_files(patterns: str | list,
                          match_type: str = "ext", 
                          top_only: bool = False, 
                          dirs_to_exclude: str | list | None = None, 
-                         case_sensitive: bool = True) -> list[str]:
+                         case_sensitive: bool = True,
+                         max_workers: int | None = 1,
+                         use_cache: bool = False) -> list[str]:
     """
     Finds directories containing files that match the given patterns with various matching types.
 
@@ -312,6 +870,14 @@ def find_dirs_with_files(patterns: str | list,
         Defaults to None.
     case_sensitive : bool, optional
         Whether to perform case-sensitive matching. Defaults to True.
+    max_workers : int | None, optional
+        Number of threads scanning subdirectories concurrently, which mainly
+        pays off on network or otherwise high-latency filesystems.
+        If None, the `ThreadPoolExecutor` default is used. Defaults to 1,
+        i.e. a serial scan.
+    use_cache : bool, optional
+        Whether to reuse unmodified directory listings.
+        See `find_files`. Defaults to False.
     
     Returns
     -------
@@ -323,39 +889,31 @@ def find_dirs_with_files(patterns: str | list,
     ValueError
         If an invalid `match_type` is provided.
     """
-    # Handle nested lists with defensive programming
-    if isinstance(patterns, str):
-        patterns = [patterns]
-    elif isinstance(patterns, list):
-        patterns = flatten_list(patterns)
+    is_match = _build_predicate(patterns, match_type, case_sensitive)
     
+    # Handle nested lists with defensive programming
     if dirs_to_exclude is None:
         dirs_to_exclude = []
     elif isinstance(dirs_to_exclude, str):
         dirs_to_exclude = [dirs_to_exclude]
     elif isinstance(dirs_to_exclude, list):
-        dirs_to_exclude = flatten_list(dirs_to_exclude)
+        dirs_to_exclude = _maybe_flatten(dirs_to_exclude)
 
-    modify_pattern_func = MATCH_PATTERN_MODIFIER.get(match_type)
-    if not modify_pattern_func:
-        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {MTD_KEYS}")
-    
-    patterns = modify_pattern_func(patterns)
-
-    if top_only:
-        files = _fetch_path_items(search_path, glob_bool=False)
-    else:
-        files = _fetch_path_items(search_path)
-
-    if dirs_to_exclude:
-        files = [file for file in files if not any(excluded in file for excluded in dirs_to_exclude)]
-
-    match_func = MATCH_TYPE_DICT.get(match_type)
-    if not match_func:
-        raise ValueError(f"Invalid match_type '{match_type}'. Choose one from {MTD_KEYS}")
-
-    dirs = [os.path.dirname(file) for file in files if match_func(file, patterns, case_sensitive)]
-    return _unique_sorted(dirs)
+    # Each directory is scanned once and recorded at most once,
+    # so the result needs sorting but no deduplication
+    dirs = []
+    for batch in _fetch_dir_batches(search_path, 
+                                    glob_bool=not top_only, 
+                                    dirs_to_exclude=dirs_to_exclude,
+                                    max_workers=max_workers,
+                                    use_cache=use_cache):
+        for entry in batch:
+            # A single matching file is enough to record its directory
+            if entry.is_file() and is_match(entry.name):
+                dirs.append(os.path.dirname(entry.path))
+                break
+            
+    return sorted(dirs)
 
 
 # Extensions and Directories Search #
@@ -365,7 +923,9 @@ def find_items(search_path: str,
                skip_ext: str | list | None = None, 
                top_only: bool = False, 
                task: str = "extensions", 
-               dirs_to_exclude: str | list | None = None) -> list[str]:
+               dirs_to_exclude: str | list | None = None,
+               max_workers: int | None = 1,
+               use_cache: bool = False) -> list[str]:
     """
     Finds all unique file extensions or directories in the specified path.
 
@@ -374,7 +934,8 @@ def find_items(search_path: str,
     search_path : str
         The directory path to search within.
     skip_ext : str | list | None, optional
-        Extensions to skip while searching. Defaults to None.
+        Extensions to skip while searching, with or without the leading dot.
+        An empty string skips files without extension. Defaults to None.
     top_only : bool, optional
         If True, only searches in the top directory without subdirectories.
         Defaults to False.
@@ -384,6 +945,14 @@ def find_items(search_path: str,
     dirs_to_exclude : str | list | None, optional
         Directory or list of directories to exclude from the search.
         Defaults to None.
+    max_workers : int | None, optional
+        Number of threads scanning subdirectories concurrently, which mainly
+        pays off on network or otherwise high-latency filesystems.
+        If None, the `ThreadPoolExecutor` default is used. Defaults to 1,
+        i.e. a serial scan.
+    use_cache : bool, optional
+        Whether to reuse unmodified directory listings.
+        See `find_files`. Defaults to False.
     
     Returns
     -------
@@ -396,32 +965,46 @@ def find_items(search_path: str,
     elif isinstance(skip_ext, str):
         skip_ext = [skip_ext]
     elif isinstance(skip_ext, list):
-        skip_ext = flatten_list(skip_ext)
+        skip_ext = _maybe_flatten(skip_ext)
     
     if dirs_to_exclude is None:
         dirs_to_exclude = []
     elif isinstance(dirs_to_exclude, str):
         dirs_to_exclude = [dirs_to_exclude]
     elif isinstance(dirs_to_exclude, list):
-        dirs_to_exclude = flatten_list(dirs_to_exclude)
+        dirs_to_exclude = _maybe_flatten(dirs_to_exclude)
 
-    if top_only:
-        items = _fetch_path_items(search_path, glob_bool=False)
-    else:
-        items = _fetch_path_items(search_path)
-
-    if dirs_to_exclude:
-        items = [item for item in items if not any(excluded in item for excluded in dirs_to_exclude)]
+    items = _fetch_path_items(search_path, 
+                              glob_bool=not top_only, 
+                              dirs_to_exclude=dirs_to_exclude,
+                              max_workers=max_workers,
+                              use_cache=use_cache)
 
     if task == "extensions":
-        extensions = [os.path.splitext(file)[1] for file in items 
-                      if os.path.isfile(file) and os.path.splitext(file)[1] not in skip_ext]
+        skip_ext = _build_ext_set(skip_ext, lowercase=False, empty="")
+        extensions = (ext for entry in items 
+                      if entry.is_file() and (ext := os.path.splitext(entry.name)[1]) not in skip_ext)
         return _unique_sorted(extensions)
     elif task == "directories":
-        dirs = [item for item in items if os.path.isdir(item)]
-        return _unique_sorted(dirs)
+        # Paths are unique by construction, so no set is needed
+        return sorted(entry.path for entry in items if entry.is_dir())
     else:
         raise ValueError("Invalid task. Use 'extensions' or 'directories'.")
+
+
+# Cache Management #
+#~~~~~~~~~~~~~~~~~~#
+
+def clear_path_cache() -> None:
+    """
+    Clears the directory listings kept by searches run with `use_cache=True`.
+    
+    Returns
+    -------
+    None
+    """
+    with _DIR_CACHE_LOCK:
+        _DIR_CACHE.clear()
         
 #--------------------------#
 # Parameters and constants #
@@ -432,11 +1015,8 @@ def find_items(search_path: str,
 
 # Define a switch-case dictionary to handle 'match_type' options
 MATCH_TYPE_DICT = {
-    # For extension matching, we check if the file ends with the extension
-    "ext": lambda file, patterns, case_sensitive=True: (
-        os.path.isfile(file) and 
-        any(os.path.splitext(file)[1].lower() == f".{ext.lower()}" for ext in patterns)
-    ),
+    # For extension matching, we look the file extension up in a set
+    "ext": _match_ext,
     
     # For glob patterns, we use our optimised matching function
     "glob_left": _match_glob,
@@ -444,9 +1024,9 @@ MATCH_TYPE_DICT = {
     "glob_both": _match_glob,
     
     # For whole word matching, we check if the pattern exactly matches the basename
-    "ww": lambda file, patterns, case_sensitive=True: (
-        os.path.isfile(file) and 
-        any(pattern == os.path.basename(file) for pattern in patterns)
+    "ww": lambda entry, patterns, case_sensitive=True: (
+        (name := _file_name(entry)) is not None and 
+        any(pattern == name for pattern in patterns)
     )
 }
 
@@ -458,4 +1038,14 @@ MATCH_PATTERN_MODIFIER = {
     "glob_right": _add_glob_right,
     "glob_both": _add_glob_both,
     "ww": _whole_word
-}
\ No newline at end of file
+}
+
+# Directory listing cache #
+#-------------------------#
+
+# Maximum number of directory listings kept by `use_cache=True` searches
+DIR_CACHE_MAXSIZE = 4096
+
+# Listings keyed by directory path, as (modification time in ns, entries)
+_DIR_CACHE = {}
+_DIR_CACHE_LOCK = threading.Lock()
@@ -8,6 +8,7 @@
 import os
 import pwd
 import shutil
+import stat
 import grp
 
 #------------------------#
@@ -24,6 +25,42 @@ from pygenutils.strings.text_formatters import print_format_string
 # Define custom functions #
 #-------------------------#
 
+# Helpers #
+#---------#
+
+def _get_obj_type(path):
+    """
+    Private helper function to tell whether a path is a file or a directory.
+    
+    A single `os.stat` call answers both questions, instead of the two
+    system calls made by `os.path.isfile` followed by `os.path.isdir`.
+    As with those, symbolic links are followed.
+
+    Parameters
+    ----------
+    path : str
+        The path to inspect.
+    
+    Returns
+    -------
+    str | None
+        "file" or "directory", or None if the path does not exist
+        or is neither.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "directory"
+    return None
+
+
+# Main functions #
+#----------------#
+
 def modify_obj_permissions(path: str, 
                            extensions2skip: str | list = "", 
                            attr_id: int = -1) -> None:
@@ -77,14 +114,15 @@ def modify_obj_permissions(path: str,
         extensions2skip = flatten_list(extensions2skip)
     
     # Handle file-specific logic (skip certain extensions)
-    if os.path.isfile(path):
+    obj_type = _get_obj_type(path)
+    if obj_type == "file":
         if extensions2skip:
             print_format_string("Skipping the following extensions: {}", [extensions2skip])
             file_extension_list = find_items(search_path=path, skip_ext=extensions2skip, top_only=True, task="extensions")
             obj_path_list = find_files(file_extension_list, search_path=path, top_only=True)
         else:
             obj_path_list = [path]
-    elif os.path.isdir(path):
+    elif obj_type == "directory":
         obj_path_list = find_items(path, task="directories")
     else:
         raise ValueError(f"The specified path is neither a file nor a directory: '{path}'")
@@ -191,7 +229,8 @@ def modify_obj_owner(path: str,
     #######################
 
     # Handle file-specific logic (skip certain extensions)
-    if os.path.isfile(path):
+    obj_type = _get_obj_type(path)
+    if obj_type == "file":
         if extensions2skip:
             print_format_string("Skipping the following extensions: {}", [extensions2skip])
             file_extension_list = find_items(search_path=path, skip_ext=extensions2skip, top_only=True, task="extensions")
@@ -199,7 +238,7 @@ def modify_obj_owner(path: str,
         else:
             print("All extensions will be considered.")
             obj_path_list = [path]
-    elif os.path.isdir(path):
+    elif obj_type == "directory":
         obj_path_list = find_items(path, task="directories")
     else:
         raise ValueError(f"The specified path is neither a file nor a directory: '{path}'")
@@ -9,7 +9,7 @@ from filewise.file_operations.ops_handler import remove_files
 from filewise.file_operations.path_utils import find_files
 from filewise.general.introspection_utils import get_caller_args, get_type_str
 from paramlib.global_parameters import COMMON_DELIMITER_LIST
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list, flatten_to_string
+from pygenutils.arrays_and_lists.data_manipulation import flatten_list
 from pygenutils.operative_systems.os_operations import exit_info, run_system_command
 from pygenutils.strings.string_handler import ext_adder, add_str_to_path
 from pygenutils.strings.text_formatters import format_string, format_table_from_lists
@@ -127,7 +127,7 @@ def merge_files(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8",
-        shell: bool = True) -> None:
+        shell: bool = False) -> None:
     """
     Merge multiple PDF files into a single PDF document.
 
@@ -144,15 +144,20 @@ def merge_files(
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Whether to execute the command through the shell. Default is False,
+        which runs pdfunite directly and passes each path as its own argument,
+        so paths with spaces or special characters are left unchanged.
+        If True, the arguments are joined with spaces, unquoted, so that
+        the shell expands globs, '~' and environment variables in the paths.
     """
     # Apply defensive programming for nested lists
     in_path_list = flatten_list(in_path_list)
     
-    all_in_paths = flatten_to_string(in_path_list)
     out_path = out_path or ext_adder("merged_doc", EXTENSIONS[0])
-    # Define the command for merging files
-    pdfunite_cmd = format_string(PDFUNITE_TEMPLATE, (all_in_paths, out_path))
+    # Define the command for merging files, as a single line if a shell is to expand it
+    pdfunite_cmd = ["pdfunite", *in_path_list, out_path]
+    if shell:
+        pdfunite_cmd = " ".join(pdfunite_cmd)
 
     # Run the command
     process_exit_info = run_system_command(
@@ -427,8 +432,6 @@ one of the following table:
 
 ESSENTIAL_PROG_NOT_FOUND_ERROR = "Programs missing for module functionality:\n{}"
 
-PDFUNITE_TEMPLATE = "pdfunite {} {}"
-
 # Initialize #
 #------------#
 
@@ -6,6 +6,8 @@
 #----------------#
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Callable
 
 #------------------------#
@@ -19,6 +21,30 @@ from pygenutils.arrays_and_lists.data_manipulation import flatten_list
 # Define functions #
 #------------------#
 
+# Helpers #
+#---------#
+
+def _is_nested_list(obj) -> bool:
+    """
+    Checks whether an object is a list containing other lists.
+    
+    Flat lists, the common case, are detected with a single short-circuiting
+    scan, so `flatten_list` and its recursive copy are only run when needed.
+    Tuples are left alone, as they may be labels of MultiIndex columns.
+
+    Parameters
+    ----------
+    obj : object
+        The object to check.
+
+    Returns
+    -------
+    bool
+        True if `obj` is a list and any of its items is a list.
+    """
+    return isinstance(obj, list) and any(isinstance(item, list) for item in obj)
+
+
 # Data frame value handling #
 #-#-#-#-#-#-#-#-#-#-#-#-#-#-#
 
@@ -58,7 +84,7 @@ def sort_df_values(df: pd.DataFrame,
     """
     
     # Apply defensive programming for nested lists
-    if isinstance(by, list):
+    if _is_nested_list(by):
         by = flatten_list(by)
     
     df = df.sort_values(by=by,
@@ -95,7 +121,7 @@ def insert_column_in_df(df: pd.DataFrame,
     values : list, numpy.array or pandas.Series
     """
     
-    ncols = len(df.iloc[0])
+    ncols = df.shape[1]
     
     if index_col < 0:
         index_col += ncols + 1
@@ -190,15 +216,13 @@ def sort_df_indices(df: pd.DataFrame,
         If specified level doesn't exist in the index.
     """
             
-    df.sort_index(axis=axis, 
-                  level=level,
-                  ascending=ascending_bool,
-                  na_position=na_position,
-                  sort_remaining=sort_remaining_bool,
-                  ignore_index=ignore_index_bool,
-                  key=key)
-    
-    return df
+    return df.sort_index(axis=axis, 
+                         level=level,
+                         ascending=ascending_bool,
+                         na_position=na_position,
+                         sort_remaining=sort_remaining_bool,
+                         ignore_index=ignore_index_bool,
+                         key=key)
 
 
 def reindex_df(df: pd.DataFrame, 
@@ -252,30 +276,15 @@ def reindex_df(df: pd.DataFrame,
         
     else:
         
-        if isinstance(col_to_replace, str):
-
-            # Substitute the index as desired #  
-            df_reidx_drop_col\
-            = df.reindex(df[col_to_replace]).drop(columns=col_to_replace)
-            
-            # Assign the remaining values to the new data frame #
-            df_reidx_drop_col.loc[:,:]\
-            = df.drop(columns=col_to_replace).values
-            
-        elif isinstance(col_to_replace, int):
-            
-            columns = df.columns
-            colname_to_drop = columns[col_to_replace]
+        if isinstance(col_to_replace, int):
+            col_to_replace = df.columns[col_to_replace]
             
-            # Substitute the index as desired #              
-            df_reidx_drop_col\
-            = df.reindex(df.iloc[:, col_to_replace]).drop(columns=colname_to_drop)
+        # Moving the column into the index keeps every row where it is
+        # and every remaining column with its own dtype, without copying
+        # the values through a single homogenised array
+        df = df.set_index(col_to_replace)
         
-            # Assign the remaining values to the new data frame #
-            df_reidx_drop_col.loc[:,:]\
-            = df.drop(columns=colname_to_drop).values
-        
-    return df_reidx_drop_col
+    return df
 
 
 def count_data_by_concept(df: pd.DataFrame, df_cols: str | list) -> pd.DataFrame:
@@ -292,7 +301,9 @@ def count_data_by_concept(df: pd.DataFrame, df_cols: str | list) -> pd.DataFrame
     Returns
     -------
     pd.DataFrame
-        A DataFrame with counts for each group based on the specified columns.
+        A DataFrame with a single 'count' column holding the number of rows
+        of each group based on the specified columns. Rows are counted
+        whether or not their other values are missing.
 
     Raises
     ------
@@ -306,6 +317,11 @@ def count_data_by_concept(df: pd.DataFrame, df_cols: str | list) -> pd.DataFrame
     >>> import pandas as pd
     >>> df = pd.DataFrame({'category': ['A', 'B', 'A', 'C'], 'value': [1, 2, 3, 4]})
     >>> count_data_by_concept(df, 'category')
+              count
+    category       
+    A             2
+    B             1
+    C             1
     """
     if df.empty:
         raise ValueError("Input DataFrame is empty")
@@ -318,7 +334,9 @@ def count_data_by_concept(df: pd.DataFrame, df_cols: str | list) -> pd.DataFrame
     if missing_cols:
         raise KeyError(f"Columns not found in DataFrame: {missing_cols}")
     
-    data_count = df.groupby(df_cols).count()
+    # Group sizes come straight from the group codes, whereas counting
+    # non-null values would have to go through every other column
+    data_count = df.groupby(df_cols).size().to_frame("count")
     return data_count    
 
 
@@ -336,7 +354,8 @@ def concat_dfs_aux(input_file_list: list,
                    ignore_index_bool: bool | None = None,
                    drop_duplicates: bool = False,
                    dedup_subset: str | list[str] | None = None,
-                   dedup_keep: str = "first") -> pd.DataFrame:
+                   dedup_keep: str = "first",
+                   max_workers: int | None = 1) -> pd.DataFrame:
     """
     Auxiliary function to concatenate multiple CSV files into a single DataFrame.
 
@@ -374,6 +393,11 @@ def concat_dfs_aux(input_file_list: list,
         ``drop_duplicates=True``.
     dedup_keep : str, default "first"
         Which duplicates to keep. Passed to ``DataFrame.drop_duplicates``.
+    max_workers : int | None, default 1
+        Number of threads reading files concurrently. The C parser releases
+        the GIL for most of its work, so several files are parsed in parallel.
+        If None, the ``ThreadPoolExecutor`` default is used. The default of 1
+        reads the files one after another.
 
     Returns
     -------
@@ -404,29 +428,47 @@ def concat_dfs_aux(input_file_list: list,
     if ignore_index_bool is None:
         ignore_index_bool = axis == 0
     
-    file_df_list = []
-    for file in input_file_list:
+    # The parsing options are common to all files, so bind them once
+    reader = partial(csv2df,
+                     separator=separator_in,
+                     engine=engine,
+                     encoding=encoding,
+                     header=header,
+                     parse_dates=parse_dates,
+                     index_col=index_col,
+                     decimal=decimal)
+    
+    def read_file(file):
         try:
-            file_df = csv2df(file_path=file,
-                             separator=separator_in,
-                             engine=engine,
-                             encoding=encoding,
-                             header=header,
-                             parse_dates=parse_dates,
-                             index_col=index_col,
-                             decimal=decimal)
-            file_df_list.append(file_df)
+            return reader(file)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file}")
         except Exception as e:
             raise ValueError(f"Error processing file {file}: {e}")
-
-    all_file_data_df = pd.concat(
-        file_df_list,
-        axis=axis,
-        sort=sort,
-        ignore_index=ignore_index_bool,
-    )
+    
+    # Frames are kept in input order, whichever file is read first
+    if max_workers == 1:
+        file_df_list = [read_file(file) for file in input_file_list]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            file_df_list = list(executor.map(read_file, input_file_list))
+
+    # A single frame needs no alignment, only the relabelling concat would do
+    if len(file_df_list) == 1:
+        all_file_data_df = file_df_list[0]
+        if sort:
+            all_file_data_df = all_file_data_df.sort_index(axis=1 - axis)
+        if ignore_index_bool:
+            all_file_data_df = all_file_data_df.set_axis(
+                range(all_file_data_df.shape[axis]), axis=axis
+            )
+    else:
+        all_file_data_df = pd.concat(
+            file_df_list,
+            axis=axis,
+            sort=sort,
+            ignore_index=ignore_index_bool,
+        )
 
     if drop_duplicates:
         all_file_data_df = all_file_data_df.drop_duplicates(
@@ -476,22 +518,20 @@ def create_pivot_table(df: pd.DataFrame,
         raise ValueError("Input DataFrame is empty.")
     
     # Apply defensive programming for nested lists
-    if isinstance(df_values, list):
+    if _is_nested_list(df_values):
         df_values = flatten_list(df_values)
-    if isinstance(df_index, list):
+    if _is_nested_list(df_index):
         df_index = flatten_list(df_index)
     
     # Validate columns exist (handle both single values and lists)
     values_to_check = df_values if isinstance(df_values, list) else [df_values]
     index_to_check = df_index if isinstance(df_index, list) else [df_index]
     
-    for val in values_to_check:
-        if val not in df.columns:
-            raise ValueError(f"Column '{val}' not found in DataFrame.")
-    
-    for idx in index_to_check:
-        if idx not in df.columns:
-            raise ValueError(f"Column '{idx}' not found in DataFrame.")
+    # Index membership is a hash lookup, so a single pass over
+    # the requested columns is enough
+    missing_cols = [col for col in values_to_check + index_to_check if col not in df.columns]
+    if missing_cols:
+        raise ValueError(f"Column '{missing_cols[0]}' not found in DataFrame.")
     
     pivot_table = pd.pivot_table(df, 
                                  values=df_values, 
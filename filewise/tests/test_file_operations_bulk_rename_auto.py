@@ -0,0 +1,43 @@
+import pytest
+
+# Skipped where the installed pygenutils or paramlib lack the names the module imports
+bra = pytest.importorskip("filewise.file_operations.bulk_rename_auto", exc_type=ImportError)
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "c.txt").write_text("c")
+    # Only the interactive confirmation is replaced
+    monkeypatch.setattr("builtins.input", lambda prompt: "y")
+    return tmp_path
+
+
+@pytest.mark.parametrize("index_range", ["all", range(0, 2)])
+def test_reorder_objs_writes_dry_run_report(tree, index_range):
+    bra.reorder_objs(str(tree), bra.BASIC_OBJECT_TYPES[0],
+                     index_range=index_range, starting_number=1)
+
+    report = (tree / "dry-run_renaming_report.txt").read_text()
+    assert report == (f"'{tree / 'b.txt'}' renamed to '{tree / '1.txt'}'\n"
+                      f"'{tree / 'c.txt'}' renamed to '{tree / '2.txt'}'\n")
+    assert not (tree / "conflicting_files_report.txt").exists()
+    assert sorted(path.name for path in tree.glob("*.txt")) == [
+        "1.txt", "2.txt", "dry-run_renaming_report.txt"
+    ]
+
+
+@pytest.mark.parametrize("index_range", ["all", range(0, 2)])
+def test_reorder_objs_writes_conflict_report(tree, index_range):
+    # Not renamed, since its extension is skipped, but its name contains '1'
+    (tree / "x1.dat").write_text("x")
+    bra.reorder_objs(str(tree), bra.BASIC_OBJECT_TYPES[0], extensions2skip="dat",
+                     index_range=index_range, starting_number=1)
+
+    lines = (tree / "conflicting_files_report.txt").read_text().splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith(f"'{tree / 'b.txt'}' <--> '")
+    assert f"renamed to '{tree / '1.txt'}'" in lines[0]
+    assert str(tree / "x1.dat") in lines[0].split("conflicts with")[1]
+    assert not (tree / "dry-run_renaming_report.txt").exists()
+    assert (tree / "b.txt").exists() and (tree / "c.txt").exists()
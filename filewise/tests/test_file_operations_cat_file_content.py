@@ -0,0 +1,18 @@
+import pytest
+
+from filewise.file_operations import cat_file_content as cfc
+
+
+def test_cat_strips_lines_across_blocks(tmp_path, monkeypatch, capsys):
+    file_path = tmp_path / "notes.txt"
+    file_path.write_text("first  \n\tsecond\n\nlast ")
+
+    # Small blocks force lines to span several reads
+    monkeypatch.setattr(cfc, "CHUNK_SIZE", 3)
+    cfc.cat(file_path)
+    assert capsys.readouterr().out == "first\nsecond\n\nlast\n"
+
+
+def test_cat_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        cfc.cat(tmp_path / "missing.txt")
@@ -0,0 +1,220 @@
+import errno
+import os
+import shutil
+
+import pytest
+
+from filewise.file_operations import ops_handler as oh
+
+
+@pytest.fixture
+def src(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for name in ["a.txt", "b.txt", "report.csv", "notes.md"]:
+        (src_dir / name).write_text(name)
+    # Directories are never selected, even if their name matches
+    (src_dir / "dir.txt").mkdir()
+    return src_dir
+
+
+def test_copy_files_by_extension(src, tmp_path):
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    oh.copy_files("txt", str(src), str(dst))
+    assert sorted(p.name for p in dst.iterdir()) == ["a.txt", "b.txt"]
+    assert (dst / "a.txt").read_text() == "a.txt"
+    assert (src / "a.txt").exists()
+
+
+def test_move_files_by_glob_matches_names_only(src, tmp_path):
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    # "src" occurs in every path but in no file name
+    oh.move_files("src", str(src), str(dst), match_type="glob")
+    assert list(dst.iterdir()) == []
+
+    oh.move_files("port", str(src), str(dst), match_type="glob")
+    assert [p.name for p in dst.iterdir()] == ["report.csv"]
+    assert not (src / "report.csv").exists()
+
+
+def test_remove_files(src):
+    oh.remove_files(["md", "csv"], str(src))
+    assert sorted(p.name for p in src.iterdir()) == ["a.txt", "b.txt", "dir.txt"]
+
+
+def test_invalid_match_type(src):
+    with pytest.raises(ValueError, match="Invalid match_type"):
+        oh.remove_files("txt", str(src), match_type="regex")
+
+
+def test_copy_files_keeps_permissions_and_guards_same_file(src, tmp_path):
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    (src / "a.txt").chmod(0o640)
+    oh.copy_files("txt", str(src), str(dst))
+    assert (dst / "a.txt").stat().st_mode & 0o777 == 0o640
+
+    with pytest.raises(shutil.SameFileError):
+        oh.copy_files("txt", str(src), str(src))
+    assert (src / "a.txt").read_text() == "a.txt"
+
+
+def test_copy_file_falls_back_without_copy_file_range(src, tmp_path, monkeypatch):
+    monkeypatch.delattr(oh.os, "copy_file_range", raising=False)
+    oh._copy_file(str(src / "a.txt"), str(tmp_path / "copy.txt"))
+    assert (tmp_path / "copy.txt").read_text() == "a.txt"
+
+
+def test_threaded_operations(src, tmp_path):
+    dst1, dst2 = tmp_path / "dst1", tmp_path / "dst2"
+    dst1.mkdir()
+    dst2.mkdir()
+    oh.copy_files("txt", str(src), [str(dst1), str(dst2)], max_workers=4)
+    assert sorted(p.name for p in dst2.iterdir()) == ["a.txt", "b.txt"]
+
+    oh.move_files("txt", str(dst1), str(src / "dir.txt"), max_workers=4)
+    assert sorted(p.name for p in (src / "dir.txt").iterdir()) == ["a.txt", "b.txt"]
+
+    oh.copy_directories([str(src), str(dst2)], [str(tmp_path / "c1"), str(tmp_path / "c2")],
+                        max_workers=2)
+    assert (tmp_path / "c1" / "dir.txt" / "a.txt").exists()
+    assert (tmp_path / "c2" / "b.txt").exists()
+
+    # Errors raised in worker threads reach the caller
+    with pytest.raises(FileNotFoundError):
+        oh.copy_files("txt", str(src), str(tmp_path / "missing"), max_workers=2)
+
+
+def test_rsync_runs_without_shell_by_default(monkeypatch):
+    calls = []
+    monkeypatch.setattr(oh, "run_system_command",
+                        lambda command, **kwargs: calls.append((command, kwargs["shell"])))
+    monkeypatch.setattr(oh, "exit_info", lambda *args, **kwargs: True)
+
+    oh.rsync("/data/my src", "/backup/my dst")
+    # With a shell, the paths are left for it to expand
+    oh.rsync("~/data/*", "$BACKUP", delete_at_destination=False, shell=True)
+    assert calls == [
+        (["rsync", "-avh", "--delete", "/data/my src/", "/backup/my dst"], False),
+        ("rsync -avh ~/data/*/ $BACKUP", True),
+    ]
+
+
+def test_parallel_copy_directories_matches_copytree(src, tmp_path):
+    (src / "dir.txt" / "deep").mkdir()
+    (src / "dir.txt" / "deep" / "z.txt").write_text("z")
+    os.utime(src / "a.txt", (1_000_000, 1_000_000))
+
+    oh.copy_directories(str(src), str(tmp_path / "serial"))
+    oh.copy_directories(str(src), str(tmp_path / "parallel"), max_workers=4)
+
+    def listing(root):
+        return sorted((str(p.relative_to(root)), p.is_dir()) for p in root.rglob("*"))
+
+    assert listing(tmp_path / "parallel") == listing(tmp_path / "serial")
+    assert (tmp_path / "parallel" / "dir.txt" / "deep" / "z.txt").read_text() == "z"
+    assert os.stat(tmp_path / "parallel" / "a.txt").st_mtime == 1_000_000
+
+    with pytest.raises(FileExistsError):
+        oh.copy_directories(str(src), str(tmp_path / "parallel"),
+                            recursive_in_depth=False, max_workers=4)
+
+
+def test_threaded_remove_files(src):
+    oh.remove_files("txt", str(src), max_workers=4)
+    assert sorted(p.name for p in src.iterdir()) == ["dir.txt", "notes.md", "report.csv"]
+
+
+def test_make_directories_with_shared_prefixes(tmp_path):
+    oh.make_directories([str(tmp_path / "a"), [str(tmp_path / "a" / "b" / "c"), str(tmp_path / "a-b")],
+                         str(tmp_path / "a" / "b") + "/", str(tmp_path / "a")])
+    assert (tmp_path / "a" / "b" / "c").is_dir()
+    assert (tmp_path / "a-b").is_dir()
+
+
+def test_remove_directories(src, tmp_path):
+    other = tmp_path / "other"
+    (other / "deep").mkdir(parents=True)
+    oh.remove_directories([str(src), str(other), str(tmp_path / "missing")], max_workers=2)
+    assert not src.exists() and not other.exists()
+
+
+def test_move_files_to_several_destinations(src, tmp_path):
+    dst1, dst2 = tmp_path / "dst1", tmp_path / "dst2"
+    dst1.mkdir()
+    dst2.mkdir()
+    oh.move_files("csv", str(src), [str(dst1), str(dst2)])
+    assert (dst1 / "report.csv").read_text() == "report.csv"
+    assert (dst2 / "report.csv").read_text() == "report.csv"
+    assert not (src / "report.csv").exists()
+
+
+@pytest.mark.parametrize("errno_value, fallback", [(errno.EXDEV, True), (errno.EACCES, False)])
+def test_move_files_falls_back_across_filesystems_only(src, tmp_path, monkeypatch,
+                                                       errno_value, fallback):
+    def replace(src_path, dst_path):
+        raise OSError(errno_value, os.strerror(errno_value))
+
+    monkeypatch.setattr(oh.os, "replace", replace)
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    if fallback:
+        oh.move_files("csv", str(src), str(dst))
+        assert (dst / "report.csv").read_text() == "report.csv"
+    else:
+        with pytest.raises(PermissionError):
+            oh.move_files("csv", str(src), str(dst))
+        assert (src / "report.csv").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes are POSIX-only")
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_copy_directories_reports_special_files(src, tmp_path, max_workers):
+    os.mkfifo(src / "dir.txt" / "pipe")
+    dst = tmp_path / "dst"
+
+    # Reading the pipe would block forever, so it is reported instead
+    with pytest.raises(shutil.Error, match="pipe"):
+        oh.copy_directories(str(src), str(dst), max_workers=max_workers)
+    assert (dst / "a.txt").read_text() == "a.txt"
+    assert not (dst / "dir.txt" / "pipe").exists()
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_copy_directories_symlinks(src, tmp_path, max_workers):
+    os.symlink("a.txt", src / "link.txt")
+    os.symlink("dir.txt", src / "link_dir")
+
+    oh.copy_directories(str(src), str(tmp_path / "followed"), max_workers=max_workers)
+    assert not (tmp_path / "followed" / "link.txt").is_symlink()
+    assert (tmp_path / "followed" / "link.txt").read_text() == "a.txt"
+    assert (tmp_path / "followed" / "link_dir").is_dir()
+    assert not (tmp_path / "followed" / "link_dir").is_symlink()
+
+    oh.copy_directories(str(src), str(tmp_path / "kept"), max_workers=max_workers, symlinks=True)
+    assert os.readlink(tmp_path / "kept" / "link.txt") == "a.txt"
+    assert os.readlink(tmp_path / "kept" / "link_dir") == "dir.txt"
+
+    # A dangling link can only be kept as a link
+    os.symlink("missing.txt", src / "dangling")
+    oh.copy_directories(str(src), str(tmp_path / "kept2"), max_workers=max_workers, symlinks=True)
+    assert os.readlink(tmp_path / "kept2" / "dangling") == "missing.txt"
+    with pytest.raises(shutil.Error, match="dangling"):
+        oh.copy_directories(str(src), str(tmp_path / "followed2"), max_workers=max_workers)
+
+
+@pytest.mark.parametrize("operation", [oh.move_files, oh.copy_files])
+def test_threaded_operations_keep_last_file_with_shared_name(tmp_path, operation):
+    inputs = []
+    for i in range(8):
+        input_dir = tmp_path / f"in{i}"
+        input_dir.mkdir()
+        (input_dir / "same.txt").write_text(str(i) * 100_000)
+        inputs.append(str(input_dir))
+    dst = tmp_path / "dst"
+    dst.mkdir()
+
+    operation("txt", inputs, str(dst), max_workers=8)
+    assert (dst / "same.txt").read_text() == "7" * 100_000
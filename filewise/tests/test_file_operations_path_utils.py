@@ -0,0 +1,185 @@
+import os
+
+import pytest
+
+from filewise.file_operations import path_utils as pu
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel_path in [
+        "a.txt",
+        "b.PDF",
+        "sub/c.txt",
+        "sub/report_2024.csv",
+        "sub/deep/d.txt",
+        "skip/e.txt",
+    ]:
+        file_path = tmp_path / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("x")
+    (tmp_path / "empty").mkdir()
+    return tmp_path
+
+
+def test_find_files_ext_recursive_and_case_insensitive(tree):
+    found = pu.find_files(["txt", "pdf"], str(tree))
+    assert found == sorted([
+        str(tree / "a.txt"),
+        str(tree / "b.PDF"),
+        str(tree / "sub" / "c.txt"),
+        str(tree / "sub" / "deep" / "d.txt"),
+        str(tree / "skip" / "e.txt"),
+    ])
+
+
+def test_find_files_ext_accepts_dotted_extensions(tree):
+    assert pu.find_files([".PDF"], str(tree)) == [str(tree / "b.PDF")]
+
+
+def test_find_files_top_only_and_exclusions(tree):
+    assert pu.find_files("txt", str(tree), top_only=True) == [str(tree / "a.txt")]
+
+    found = pu.find_files("txt", str(tree), dirs_to_exclude=["skip", "deep"])
+    assert found == [str(tree / "a.txt"), str(tree / "sub" / "c.txt")]
+
+
+def test_find_files_glob_and_whole_word(tree):
+    assert pu.find_files("report", str(tree), match_type="glob_right") == [
+        str(tree / "sub" / "report_2024.csv")
+    ]
+    assert pu.find_files("2024.csv", str(tree), match_type="glob_left") == [
+        str(tree / "sub" / "report_2024.csv")
+    ]
+    assert pu.find_files("A.TXT", str(tree), match_type="glob_both", case_sensitive=False) == [
+        str(tree / "a.txt")
+    ]
+    assert pu.find_files("A.TXT", str(tree), match_type="glob_both") == []
+    assert pu.find_files("c.txt", str(tree), match_type="ww") == [str(tree / "sub" / "c.txt")]
+
+
+def test_find_files_invalid_match_type(tree):
+    with pytest.raises(ValueError, match="Invalid match_type"):
+        pu.find_files("txt", str(tree), match_type="regex")
+
+
+def test_find_dirs_with_files(tree):
+    assert pu.find_dirs_with_files("txt", str(tree)) == sorted([
+        str(tree),
+        str(tree / "sub"),
+        str(tree / "sub" / "deep"),
+        str(tree / "skip"),
+    ])
+    assert pu.find_dirs_with_files("csv", str(tree), dirs_to_exclude="deep") == [str(tree / "sub")]
+
+
+def test_find_items(tree):
+    assert pu.find_items(str(tree)) == [".PDF", ".csv", ".txt"]
+    assert pu.find_items(str(tree), skip_ext=".txt", top_only=True) == [".PDF"]
+    assert pu.find_items(str(tree), skip_ext=["txt", "csv"]) == [".PDF"]
+    assert pu.find_items(str(tree), task="directories", dirs_to_exclude="skip") == sorted([
+        str(tree / "sub"),
+        str(tree / "sub" / "deep"),
+        str(tree / "empty"),
+    ])
+
+    with pytest.raises(ValueError, match="Invalid task"):
+        pu.find_items(str(tree), task="files")
+
+
+def test_find_files_does_not_follow_directory_symlinks(tree):
+    os.symlink(tree / "sub", tree / "link")
+    found = pu.find_files("txt", str(tree))
+    assert str(tree / "link" / "c.txt") not in found
+
+
+def test_matchers_accept_plain_paths(tree):
+    file_path = str(tree / "sub" / "c.txt")
+    assert pu.MATCH_TYPE_DICT["ext"](file_path, ["txt"])
+    assert pu.MATCH_TYPE_DICT["ww"](file_path, ["c.txt"])
+    assert pu.MATCH_TYPE_DICT["glob_left"](file_path, ["*.txt"])
+    assert not pu.MATCH_TYPE_DICT["ext"](str(tree / "sub"), ["txt"])
+
+
+def test_threaded_scan_matches_serial_scan(tree):
+    serial = pu.find_files("txt", str(tree), dirs_to_exclude="deep")
+    assert pu.find_files("txt", str(tree), dirs_to_exclude="deep", max_workers=4) == serial
+    assert pu.find_dirs_with_files("txt", str(tree), max_workers=4) == pu.find_dirs_with_files("txt", str(tree))
+    assert pu.find_items(str(tree), task="directories", max_workers=None) == pu.find_items(str(tree), task="directories")
+
+
+def test_multiprocess_search_matches_serial_search(tree):
+    for match_type, patterns in [("ext", "txt"), ("glob_left", "*.csv")]:
+        serial = pu.find_files(patterns, str(tree), match_type=match_type, dirs_to_exclude="deep")
+        parallel = pu.find_files(patterns, str(tree), match_type=match_type,
+                                 dirs_to_exclude="deep", processes=2)
+        assert parallel == serial
+
+
+def test_find_files_iter_and_unsorted_results(tree):
+    expected = pu.find_files("txt", str(tree))
+    assert sorted(pu.find_files_iter("txt", str(tree))) == expected
+    assert sorted(pu.find_files("txt", str(tree), sort=False)) == expected
+
+    # Arguments are validated eagerly, before any iteration
+    with pytest.raises(ValueError, match="Invalid match_type"):
+        pu.find_files_iter("txt", str(tree), match_type="regex")
+
+
+def test_cached_search_sees_directory_changes(tree):
+    pu.clear_path_cache()
+    expected = pu.find_files("txt", str(tree))
+    assert pu.find_files("txt", str(tree), use_cache=True) == expected
+    assert str(tree / "sub") in pu._DIR_CACHE
+    assert pu.find_files("txt", str(tree), use_cache=True) == expected
+
+    new_file = tree / "sub" / "f.txt"
+    new_file.write_text("x")
+    # Make the directory change visible even on coarse timestamp filesystems
+    stat = os.stat(tree / "sub")
+    os.utime(tree / "sub", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert str(new_file) in pu.find_files("txt", str(tree), use_cache=True)
+
+    pu.clear_path_cache()
+    assert not pu._DIR_CACHE
+
+
+def test_empty_extension_semantics(tree):
+    (tree / "README").write_text("x")
+    (tree / "sub" / "trailing.").write_text("x")
+
+    # An empty extension matches names ending in a dot, not extensionless names
+    assert pu.find_files([""], str(tree)) == [str(tree / "sub" / "trailing.")]
+    assert pu.find_dirs_with_files([""], str(tree)) == [str(tree / "sub")]
+    assert pu.MATCH_TYPE_DICT["ext"](str(tree / "sub" / "trailing."), [""])
+    assert not pu.MATCH_TYPE_DICT["ext"](str(tree / "README"), [""])
+
+    # In find_items, it skips files without extension
+    assert "" in pu.find_items(str(tree), top_only=True)
+    assert "" not in pu.find_items(str(tree), skip_ext="", top_only=True)
+
+
+def test_mp_context_never_forks_implicitly(monkeypatch):
+    monkeypatch.setattr(pu.multiprocessing, "get_start_method", lambda allow_none=False: None)
+    assert pu._get_mp_context().get_start_method() != "fork"
+
+
+def test_predicate_dispatches_on_match_type(tree, monkeypatch):
+    expected = pu.find_files("txt", str(tree))
+    # Wrapping a built-in matcher does not lose its specialised predicate
+    matcher = pu.MATCH_TYPE_DICT["ext"]
+    monkeypatch.setitem(pu.MATCH_TYPE_DICT, "ext",
+                        lambda entry, patterns, case_sensitive=True:
+                        matcher(entry, patterns, case_sensitive))
+    assert pu.find_files("txt", str(tree)) == expected
+
+    # A match type registered after import falls back to its own matcher
+    monkeypatch.setitem(pu.MATCH_PATTERN_MODIFIER, "prefix", tuple)
+    monkeypatch.setitem(pu.MATCH_TYPE_DICT, "prefix",
+                        lambda entry, patterns, case_sensitive=True:
+                        pu._file_name(entry).startswith(patterns))
+    assert pu.find_files(["c", "report"], str(tree), match_type="prefix") == [
+        str(tree / "sub" / "c.txt"),
+        str(tree / "sub" / "report_2024.csv"),
+    ]
+    assert pu.find_dirs_with_files("d", str(tree), match_type="prefix") == [str(tree / "sub" / "deep")]
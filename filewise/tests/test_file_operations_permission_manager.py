@@ -0,0 +1,28 @@
+import os
+import stat
+
+import pytest
+
+from filewise.file_operations import permission_manager as pm
+
+
+def test_get_obj_type(tmp_path):
+    file_path = tmp_path / "a.txt"
+    file_path.write_text("x")
+    os.symlink(file_path, tmp_path / "link")
+
+    assert pm._get_obj_type(str(file_path)) == "file"
+    assert pm._get_obj_type(str(tmp_path / "link")) == "file"
+    assert pm._get_obj_type(str(tmp_path)) == "directory"
+    assert pm._get_obj_type(str(tmp_path / "missing")) is None
+
+
+def test_modify_obj_permissions_on_file_and_missing_path(tmp_path):
+    file_path = tmp_path / "a.txt"
+    file_path.write_text("x")
+
+    pm.modify_obj_permissions(str(file_path), attr_id=0o640)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
+
+    with pytest.raises(ValueError, match="neither a file nor a directory"):
+        pm.modify_obj_permissions(str(tmp_path / "missing"), attr_id=0o640)
@@ -0,0 +1,20 @@
+import pytest
+
+# Skipped where the installed pygenutils lacks the names the module imports,
+# or where the PDF programs it checks for on import are not installed
+pdf_tools = pytest.importorskip("filewise.format_converters.pdf_tools", exc_type=ImportError)
+
+
+def test_merge_files_runs_without_shell_by_default(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pdf_tools, "run_system_command",
+                        lambda command, **kwargs: calls.append((command, kwargs["shell"])))
+    monkeypatch.setattr(pdf_tools, "exit_info", lambda *args, **kwargs: True)
+
+    pdf_tools.merge_files(["/docs/my a.pdf", ["/docs/b.pdf"]], "/docs/my merged.pdf")
+    # With a shell, the paths are left for it to expand
+    pdf_tools.merge_files(["~/docs/*.pdf"], "$OUT", shell=True)
+    assert calls == [
+        (["pdfunite", "/docs/my a.pdf", "/docs/b.pdf", "/docs/my merged.pdf"], False),
+        ("pdfunite ~/docs/*.pdf $OUT", True),
+    ]
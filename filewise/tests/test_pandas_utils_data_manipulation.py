@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from filewise.pandas_utils import data_manipulation as dm
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"k": ["a", "b", "c"], "v": [1.5, 2.5, 3.5], "w": [4, 5, 6]},
+                        index=[10, 11, 12])
+
+
+def test_reindex_df_by_column_keeps_dtypes(df):
+    by_name = dm.reindex_df(df, "k")
+    assert by_name.index.tolist() == ["a", "b", "c"]
+    assert by_name.columns.tolist() == ["v", "w"]
+    assert by_name["w"].dtype == df["w"].dtype
+    assert dm.reindex_df(df, 0).equals(by_name)
+
+
+def test_reindex_df_by_values(df):
+    reindexed = dm.reindex_df(df, vals_to_replace=[12, 10])
+    assert reindexed["w"].tolist() == [6, 4]
+
+    with pytest.raises(ValueError):
+        dm.reindex_df(df)
+
+
+def test_count_data_by_concept_counts_rows_per_group():
+    df = pd.DataFrame({"k": ["a", "b", "a"], "v": [1.0, None, 3.0], "w": [1, 2, 3]})
+    counts = dm.count_data_by_concept(df, "k")
+    assert counts.columns.tolist() == ["count"]
+    assert counts["count"].to_dict() == {"a": 2, "b": 1}
+
+    with pytest.raises(KeyError):
+        dm.count_data_by_concept(df, ["k", "missing"])
+
+
+def test_create_pivot_table(df):
+    df = df.assign(g=["x", "y", "x"])
+    pivot = dm.create_pivot_table(df, ["v", ["w"]], "g", "sum")
+    assert pivot.to_dict() == {"v": {"x": 5.0, "y": 2.5}, "w": {"x": 10, "y": 5}}
+
+    with pytest.raises(ValueError, match="'missing' not found"):
+        dm.create_pivot_table(df, "v", ["g", "missing"], "sum")
+
+
+def test_insert_column_in_df(df):
+    dm.insert_column_in_df(df, -1, "z", [7, 8, 9])
+    assert df.columns.tolist() == ["k", "v", "w", "z"]
+
+    empty = pd.DataFrame({"a": []})
+    dm.insert_column_in_df(empty, -1, "b", [])
+    assert empty.columns.tolist() == ["a", "b"]
+
+
+def test_sort_df_values_with_flat_and_nested_keys(df):
+    expected = df.sort_values(by=["w", "v"], ascending=False)
+    assert dm.sort_df_values(df, ["w", "v"], ascending_bool=False).equals(expected)
+    assert dm.sort_df_values(df, [["w"], ["v"]], ascending_bool=False).equals(expected)
+
+
+def test_sort_df_indices_returns_sorted_frame(df):
+    shuffled = df.iloc[[2, 0, 1]]
+    result = dm.sort_df_indices(shuffled, ascending_bool=False)
+    assert result.index.tolist() == [12, 11, 10]
+    assert dm.sort_df_indices(shuffled, ignore_index_bool=True)["w"].tolist() == [4, 5, 6]
+    # The input frame is left untouched
+    assert shuffled.index.tolist() == [12, 10, 11]
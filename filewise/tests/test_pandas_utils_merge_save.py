@@ -120,3 +120,34 @@ def test_merge_csv_files_axis1_user_cancel_raises(tmp_path, monkeypatch):
             keep_data_in_sections=False,
             save_merged_file=False,
         )
+
+
+def test_concat_dfs_aux_threaded_read_keeps_file_order(tmp_path):
+    files = []
+    for i in range(5):
+        file = tmp_path / f"{i}.csv"
+        pd.DataFrame({"x": [i, i]}).to_csv(file, index=False)
+        files.append(str(file))
+
+    kwargs = dict(separator_in=",", engine="c", encoding=None, header=0,
+                  parse_dates=False, index_col=None, decimal=".")
+    merged = dm.concat_dfs_aux(files, max_workers=3, **kwargs)
+    assert merged["x"].tolist() == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+
+    with pytest.raises(FileNotFoundError, match="missing.csv"):
+        dm.concat_dfs_aux(files + [str(tmp_path / "missing.csv")], max_workers=3, **kwargs)
+
+
+@pytest.mark.parametrize("axis, ignore_index_bool, sort",
+                         [(0, None, False), (0, False, True), (1, None, True), (1, True, False)])
+def test_concat_dfs_aux_single_file_matches_concat(tmp_path, axis, ignore_index_bool, sort):
+    file = tmp_path / "one.csv"
+    pd.DataFrame({"k": [3, 1, 2], "b": [1, 2, 3], "a": [4, 5, 6]}).to_csv(file, index=False)
+
+    kwargs = dict(separator_in=",", engine="c", encoding=None, header=0,
+                  parse_dates=False, index_col="k", decimal=".")
+    result = dm.concat_dfs_aux([str(file)], axis=axis, sort=sort,
+                               ignore_index_bool=ignore_index_bool, **kwargs)
+    expected = pd.concat([pd.read_csv(file, index_col="k")], axis=axis, sort=sort,
+                         ignore_index=axis == 0 if ignore_index_bool is None else ignore_index_bool)
+    pd.testing.assert_frame_equal(result, expected)